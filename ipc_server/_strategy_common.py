@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# © 2025 Cayman Sunsets Holidays Ltd. All rights reserved.
+#
+# This software and its source code are proprietary and confidential.
+# Unauthorized copying, distribution, or modification of this file, in
+# whole or in part, without the express written permission of
+# Cayman Sunsets Holidays Ltd is strictly prohibited.
+"""
+Wire-format helpers shared by IPCStrategy and SimpleTestStrategy, so both strategies
+send the UI identically shaped messages.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def strategy_state_dict(
+    seq: int,
+    entry: float | None,
+    stop_loss: float | None,
+    target: float | None,
+    trailing_activation: float | None,
+    trailing_active: bool,
+) -> dict[str, Any]:
+    """
+    Build the strategy_state dict sent to the UI.
+
+    Args:
+        seq: State sequence number (0 before the first update)
+        entry: Entry price, or None while flat
+        stop_loss: Current stop loss price
+        target: Take-profit price
+        trailing_activation: Trailing stop activation price
+        trailing_active: Whether the trailing stop is active
+
+    Returns:
+        {} before any update, {"seq": seq} while flat, otherwise the full state with seq
+    """
+    if entry is None:
+        return {"seq": seq} if seq else {}
+    return {
+        "SL": stop_loss,
+        "TP": target,
+        "ENTRY": entry,
+        "TSA": trailing_activation,
+        "TRAILING_STOP_ACTIVE": trailing_active,
+        "seq": seq,
+    }
+
+
+def format_event_id(prefix: str, counter: int, now_ms: int) -> str:
+    """
+    Build a strategy event ID in the readable "{instance}_{counter}_{epoch ms}" form.
+
+    Args:
+        prefix: Instance name followed by "_"
+        counter: Per-instance event counter
+        now_ms: Event time in epoch milliseconds
+
+    Returns:
+        Event ID, unique per instance; the UI dedupes strategy events on it
+    """
+    return f"{prefix}{counter}_{now_ms}"
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# © 2025 Cayman Sunsets Holidays Ltd. All rights reserved.
+#
+# This software and its source code are proprietary and confidential.
+# Unauthorized copying, distribution, or modification of this file, in
+# whole or in part, without the express written permission of
+# Cayman Sunsets Holidays Ltd is strictly prohibited.
+"""
+Per-tick position arithmetic for IPCStrategy and SimpleTestStrategy, kept free of Python objects so it can be
+JIT-compiled with Numba when available (plain Python otherwise).
+
+The kernels carry explicit signatures, so Numba compiles them eagerly at import (or loads them from the
+on-disk cache) instead of on the first tick inside the event loop. Callers pass prices as floats.
+"""
+
+from __future__ import annotations
+
+# Optional JIT compiler (falls back to a no-op decorator)
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit supporting both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+
+# Eager Numba signatures: prices are float64, sign and nanosecond counts int64
+_TICK_UPDATE_SIGNATURE = (
+    "Tuple((int64, float64, float64))"
+    "(float64, int64, float64, float64, boolean, float64, float64, int64, int64)"
+)
+_TRAILING_UPDATE_SIGNATURE = (
+    "Tuple((int64, float64, float64))"
+    "(float64, int64, float64, float64, boolean, float64, float64)"
+)
+
+# Action codes returned by tick_update
+ACTION_NONE = 0
+ACTION_TRAIL_UPDATED = 1
+ACTION_TRAIL_ACTIVATED = 2
+ACTION_STOP_HIT = 3
+ACTION_TIME_EXIT = 4
+
+
+@njit(_TICK_UPDATE_SIGNATURE, cache=True)
+def tick_update(
+    current_price: float,
+    sign: int,
+    stop_loss: float,
+    peak_price: float,
+    trailing_active: bool,
+    trailing_activation: float,
+    trailing_distance: float,
+    elapsed_ns: int,
+    max_duration_ns: int,
+) -> tuple[int, float, float]:
+    """
+    Decide what a tick does to an open position.
+
+    Args:
+        current_price: Latest market price
+        sign: +1 for LONG, -1 for SHORT
+        stop_loss: Current stop loss price
+        peak_price: Most favourable price seen since trailing activation (entry before)
+        trailing_active: Whether the trailing stop is active
+        trailing_activation: Price at which the trailing stop activates
+        trailing_distance: Distance of the trailing stop from the peak
+        elapsed_ns: Nanoseconds since the position was opened
+        max_duration_ns: Maximum position duration in nanoseconds
+
+    Returns:
+        (action code, new stop loss, new peak price); prices are unchanged unless the
+        action is ACTION_TRAIL_UPDATED or ACTION_TRAIL_ACTIVATED
+    """
+    if elapsed_ns > max_duration_ns:
+        return ACTION_TIME_EXIT, stop_loss, peak_price
+
+    if sign * (current_price - stop_loss) <= 0.0:
+        return ACTION_STOP_HIT, stop_loss, peak_price
+
+    if trailing_active:
+        if sign * (current_price - peak_price) > 0.0:
+            return ACTION_TRAIL_UPDATED, current_price - sign * trailing_distance, current_price
+    elif sign * (current_price - trailing_activation) >= 0.0:
+        return ACTION_TRAIL_ACTIVATED, current_price - sign * trailing_distance, current_price
+
+    return ACTION_NONE, stop_loss, peak_price
+
+
+@njit(_TRAILING_UPDATE_SIGNATURE, cache=True)
+def trailing_update(
+    current_price: float,
+    sign: int,
+    stop_loss: float,
+    peak_price: float,
+    trailing_active: bool,
+    trailing_activation: float,
+    trailing_distance: float,
+) -> tuple[int, float, float]:
+    """
+    Trailing-stop step only (no stop-loss or time-limit exits), for the test strategy.
+
+    Args:
+        current_price: Latest market price
+        sign: +1 for LONG, -1 for SHORT
+        stop_loss: Current stop loss price
+        peak_price: Most favourable price seen since trailing activation (entry before)
+        trailing_active: Whether the trailing stop is active
+        trailing_activation: Price at which the trailing stop activates
+        trailing_distance: Distance of the trailing stop from the peak
+
+    Returns:
+        (action code (ACTION_NONE, ACTION_TRAIL_ACTIVATED or ACTION_TRAIL_UPDATED), new stop loss,
+        new peak price); prices are unchanged for ACTION_NONE
+    """
+    if trailing_active:
+        if sign * (current_price - peak_price) > 0.0:
+            return ACTION_TRAIL_UPDATED, current_price - sign * trailing_distance, current_price
+    elif sign * (current_price - trailing_activation) >= 0.0:
+        return ACTION_TRAIL_ACTIVATED, current_price - sign * trailing_distance, current_price
+
+    return ACTION_NONE, stop_loss, peak_price
@@ -8,23 +8,104 @@
 EAI Prediction Provider
 
 Provides helper methods for querying predictions from ClickHouse.
-Manages its own ClickHouse connection using clickhouse-connect library.
+Manages its own ClickHouse connection using clickhouse-driver (native TCP) when
+installed, falling back to the clickhouse-connect (HTTP) library. Async callers are
+served by an asynch (asyncio native TCP) connection pool when installed.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import importlib.util
+import sys
+import threading
 from datetime import datetime
-from typing import Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+if TYPE_CHECKING:
+    from asynch import Pool as AsyncPool
+    from clickhouse_driver import Client as NativeClient
 
-# Use clickhouse-connect directly instead of external wrapper
+# Use clickhouse-connect directly instead of external wrapper. Availability is probed
+# without importing; the driver itself is imported on first provider construction.
+HAS_CLICKHOUSE = importlib.util.find_spec("clickhouse_connect") is not None
+if not HAS_CLICKHOUSE:
+    print("⚠️  clickhouse-connect not installed. Run: pip install clickhouse-connect")
+
+# Optional native TCP driver (no HTTP framing); replaces clickhouse-connect when a native port is configured
+HAS_CLICKHOUSE_DRIVER = importlib.util.find_spec("clickhouse_driver") is not None
+
+# Optional asyncio native TCP driver; lets async callers query without a thread-pool handoff
+HAS_ASYNCH = importlib.util.find_spec("asynch") is not None
+
+# Optional fast ISO8601 parser (falls back to datetime.fromisoformat)
 try:
-    import clickhouse_connect
-    HAS_CLICKHOUSE = True
+    import ciso8601
+    HAS_CISO8601 = True
 except ImportError:
-    HAS_CLICKHOUSE = False
-    print("⚠️  clickhouse-connect not installed. Run: pip install clickhouse-connect")
+    HAS_CISO8601 = False
+
+# Python 3.11+ fromisoformat accepts a trailing 'Z' directly, so no string rewrite is needed
+_ISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Rows per streamed block; bounds peak memory for wide time ranges
+STREAM_BATCH_SIZE = 50_000
+
+# HTTP connection pool sizing so concurrent queries don't serialize on one connection
+POOL_MAX_SIZE = 16
+POOL_NUM_POOLS = 4
+
+# asyncio connection pool sizing (asynch)
+ASYNC_POOL_MIN_SIZE = 1
+ASYNC_POOL_MAX_SIZE = 4
+
+# Server-side query settings. Datetimes are formatted in SQL under their original
+# column names, so WHERE/ORDER BY must keep resolving to the raw columns.
+# (Literal % in SQL is written as %% because parameters are bound client-side.)
+# The columns are plain DateTime (whole seconds), so the microseconds are a literal
+# '.000000' rather than %f, whose output differs between server versions.
+QUERY_SETTINGS = {"prefer_column_name_to_alias": 1}
+
+# Opt-in server-side query cache (ClickHouse 23.1+; older servers reject the settings as
+# unknown). It serves repeated identical polls without re-executing the SELECT, including
+# ones from other processes.
+QUERY_CACHE_TTL_SECONDS = 5
+QUERY_CACHE_SETTINGS = {
+    "use_query_cache": 1,
+    "query_cache_ttl": QUERY_CACHE_TTL_SECONDS,
+}
+
+# Standard predictions for a set of (version, symbol, hours) keys, read directly from
+# eai_api_predictions (no enrichment join). Whitespace is collapsed once at import.
+_STANDARD_PREDICTIONS_SQL = " ".join("""
+    SELECT
+        toString(id) as id,
+        version,
+        symbol,
+        hours,
+        formatDateTime(prediction_time, '%%FT%%T.000000Z', 'UTC') as prediction_time,
+        prediction_price,
+        formatDateTime(predicted_time, '%%FT%%T.000000Z', 'UTC') as predicted_time,
+        predicted_price
+    FROM eai_api_predictions
+    WHERE (version, symbol, hours) IN %(keys)s
+      AND prediction_time >= %(start_time)s
+      AND prediction_time <= %(end_time)s
+    ORDER BY prediction_time ASC
+""".split())
+
+
+def _parse_iso(value: str | datetime) -> datetime:
+    """Parse an ISO8601 timestamp (trailing 'Z' allowed); datetimes pass through untouched."""
+    if isinstance(value, datetime):
+        return value
+    if HAS_CISO8601:
+        return ciso8601.parse_datetime(value)
+    if _ISO_HANDLES_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 class EAIPredictionProvider:
@@ -45,37 +126,196 @@ class EAIPredictionProvider:
         clickhouse_user: str = "default",
         clickhouse_password: str = "",
         clickhouse_database: str = "default",
+        clickhouse_native_port: int | None = None,
+        clickhouse_query_cache: bool = False,
     ):
         """
         Initialize EAI Prediction Provider.
 
         Args:
             clickhouse_host: ClickHouse host
-            clickhouse_port: ClickHouse port (default: 9100 for native protocol)
+            clickhouse_port: ClickHouse HTTP interface port, used by clickhouse-connect (default: 9100)
             clickhouse_user: ClickHouse username
             clickhouse_password: ClickHouse password
             clickhouse_database: ClickHouse database
+            clickhouse_native_port: ClickHouse native TCP protocol port (usually 9000). Opt-in: when
+                set and clickhouse-driver is installed, queries use the native driver on this port
+                instead of clickhouse-connect over HTTP
+            clickhouse_query_cache: Opt-in: enable the server-side query cache for every query.
+                Requires ClickHouse 23.1 or newer (older servers reject the settings)
         """
-        if not HAS_CLICKHOUSE:
+        self.native_client: NativeClient | None = None
+        # clickhouse_driver.Client is one TCP connection that carries one query at a time
+        self._native_lock = threading.Lock()
+        self.clickhouse_client = None
+        self.async_pool: AsyncPool | None = None
+        self._async_pool_started = False
+        # Concurrent first queries would each call startup(); only the first one may
+        self._async_pool_lock = asyncio.Lock()
+        self.database = clickhouse_database
+        self._query_settings = (
+            {**QUERY_SETTINGS, **QUERY_CACHE_SETTINGS} if clickhouse_query_cache else QUERY_SETTINGS
+        )
+
+        if clickhouse_native_port is not None and HAS_CLICKHOUSE_DRIVER:
+            from clickhouse_driver import Client as NativeClient
+
+            self.native_client = NativeClient(
+                host=clickhouse_host,
+                port=clickhouse_native_port,
+                user=clickhouse_user,
+                password=clickhouse_password,
+                database=clickhouse_database,
+            )
+        elif HAS_CLICKHOUSE:
+            import clickhouse_connect
+            from clickhouse_connect.driver import httputil
+
+            self.clickhouse_client = clickhouse_connect.get_client(
+                host=clickhouse_host,
+                port=clickhouse_port,
+                username=clickhouse_user,
+                password=clickhouse_password,
+                database=clickhouse_database,
+                pool_mgr=httputil.get_pool_manager(maxsize=POOL_MAX_SIZE, num_pools=POOL_NUM_POOLS),
+                compress="lz4",
+            )
+        else:
             raise ImportError("clickhouse-connect is required. Run: pip install clickhouse-connect")
 
-        self.clickhouse_client = clickhouse_connect.get_client(
-            host=clickhouse_host,
-            port=clickhouse_port,
-            username=clickhouse_user,
-            password=clickhouse_password,
-            database=clickhouse_database,
-        )
-        self.database = clickhouse_database
+        # asynch speaks the native TCP protocol only, so it needs the native port; without one the
+        # *_async methods run the sync client in a worker thread instead
+        if clickhouse_native_port is not None and HAS_ASYNCH:
+            from asynch import Pool as AsyncPool
+
+            # Connections are opened lazily on the first async query (needs a running loop)
+            self.async_pool = AsyncPool(
+                minsize=ASYNC_POOL_MIN_SIZE,
+                maxsize=ASYNC_POOL_MAX_SIZE,
+                host=clickhouse_host,
+                port=clickhouse_native_port,
+                user=clickhouse_user,
+                password=clickhouse_password,
+                database=clickhouse_database,
+            )
+
+    def _execute_iter(
+        self, query: str, params: dict[str, Any], batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream a SELECT on whichever driver is active, yielding rows as dicts in batches.
+
+        Peak memory is bounded by one batch rather than the full result set. On the native
+        driver the stream holds the connection lock until it is exhausted or closed, so
+        queries from other worker threads wait instead of interleaving on the one connection;
+        callers that may stop early must close it (iter_standard_predictions does so on exit).
+        """
+        settings = {**self._query_settings, "max_block_size": batch_size}
+
+        if self.native_client is not None:
+            with self._native_lock:
+                rows = self.native_client.execute_iter(
+                    query, params, with_column_types=True, settings=settings
+                )
+                # First item of a with_column_types stream is the [(name, type), ...] header
+                column_names = [name for name, _ in next(rows, [])]
+                batch: list[dict[str, Any]] = []
+                for row in rows:
+                    batch.append(dict(zip(column_names, row)))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+            return
+
+        with self.clickhouse_client.query_row_block_stream(
+            query, parameters=params, settings=settings
+        ) as stream:
+            column_names = stream.source.column_names
+            for block in stream:
+                yield [dict(zip(column_names, row)) for row in block]
+
+    def _execute(self, query: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run a SELECT on whichever driver is active and return all rows as dicts."""
+        return [row for batch in self._execute_iter(query, params) for row in batch]
+
+    async def _execute_async(self, query: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run a SELECT on the asynch pool and return all rows as dicts."""
+        from asynch import DictCursor
+
+        if not self._async_pool_started:
+            async with self._async_pool_lock:
+                if not self._async_pool_started:
+                    await self.async_pool.startup()
+                    self._async_pool_started = True
+
+        async with self.async_pool.connection() as conn:
+            async with conn.cursor(cursor=DictCursor) as cursor:
+                cursor.set_settings(self._query_settings)
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
 
     # ============================================
     # PREDICTION QUERY METHODS
     # ============================================
 
+    @staticmethod
+    def _prediction_params(
+        start_time_str: str | datetime,
+        end_time_str: str | datetime,
+        keys: list[tuple[str, str, str]],
+    ) -> dict[str, Any]:
+        """Build bind parameters for _STANDARD_PREDICTIONS_SQL."""
+        # Convert ISO strings to datetime objects for ClickHouse (no-op for datetimes)
+        return {
+            "keys": tuple(keys),
+            "start_time": _parse_iso(start_time_str),
+            "end_time": _parse_iso(end_time_str),
+        }
+
+    def _query_predictions(
+        self,
+        start_time_str: str | datetime,
+        end_time_str: str | datetime,
+        keys: list[tuple[str, str, str]],
+    ) -> dict[tuple[str, str, str], list[dict[str, Any]]]:
+        """
+        Fetch predictions for several (version, symbol, timeframe) keys in one query.
+
+        Raises on query errors so callers decide how to degrade.
+        """
+        # Datetimes arrive as RFC3339/ISO8601 UTC strings (formatted server-side)
+        rows = self._execute(
+            _STANDARD_PREDICTIONS_SQL,
+            self._prediction_params(start_time_str, end_time_str, keys),
+        )
+        return self._group_predictions(rows, keys)
+
+    @staticmethod
+    def _group_predictions(
+        rows: list[dict[str, Any]],
+        keys: list[tuple[str, str, str]],
+    ) -> dict[tuple[str, str, str], list[dict[str, Any]]]:
+        """Partition prediction rows back to the requested keys in a single pass."""
+        # hours may come back numeric while timeframes are passed as strings
+        lookup = {(version, symbol, str(timeframe)): (version, symbol, timeframe)
+                  for version, symbol, timeframe in keys}
+        grouped: dict[tuple[str, str, str], list[dict[str, Any]]] = {key: [] for key in keys}
+        for row in rows:
+            key = lookup.get((row["version"], row["symbol"], str(row["hours"])))
+            if key is None:
+                continue
+            # Share the caller's version/symbol strings instead of a fresh copy per row
+            row["version"], row["symbol"] = key[0], key[1]
+            grouped[key].append(row)
+
+        return grouped
+
     def get_standard_predictions(
         self,
-        start_time_str: str,
-        end_time_str: str,
+        start_time_str: str | datetime,
+        end_time_str: str | datetime,
         version: str,
         symbol: str,
         timeframe: str,
@@ -83,12 +323,12 @@ class EAIPredictionProvider:
         """
         Query standard predictions from eai_api_predictions table (no enrichment).
 
-        This method uses ClickHouseClientWrapper's execute_to_dataframe for proper
-        datetime formatting, matching the enriched predictions format.
+        Rows are read as dicts straight from ClickHouse (no DataFrame). Datetimes
+        are formatted by ClickHouse to match the enriched predictions format.
 
         Args:
-            start_time_str: Start time in ISO format (e.g., '2025-10-18T19:26:27Z')
-            end_time_str: End time in ISO format
+            start_time_str: Start time in ISO format (e.g., '2025-10-18T19:26:27Z') or a datetime
+            end_time_str: End time in ISO format or a datetime
             version: Prediction model version (e.g., 'V2')
             symbol: Trading symbol (e.g., 'BTC')
             timeframe: Timeframe (e.g., '1', '2', '4')
@@ -97,98 +337,142 @@ class EAIPredictionProvider:
             List of prediction dictionaries with standard fields only
         """
         try:
-            # Convert ISO strings to datetime objects for ClickHouse
-            start_time_dt = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            end_time_dt = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
-
-            # Query eai_api_predictions table directly (no enrichment join)
-            query = """
-                SELECT
-                    toString(id) as id,
-                    version,
-                    symbol,
-                    hours,
-                    prediction_time,
-                    prediction_price,
-                    predicted_time,
-                    predicted_price
-                FROM eai_api_predictions
-                WHERE version = %(version)s
-                  AND symbol = %(symbol)s
-                  AND hours = %(hours)s
-                  AND prediction_time >= %(start_time)s
-                  AND prediction_time <= %(end_time)s
-                ORDER BY prediction_time ASC
-            """
-
-            params = {
-                "version": version,
-                "symbol": symbol,
-                "hours": timeframe,
-                "start_time": start_time_dt,
-                "end_time": end_time_dt,
-            }
-
-            # Execute query using clickhouse-connect's query_df method
-            df = self.clickhouse_client.query_df(query, parameters=params)
-
-            if df is None or df.empty:
-                return []
-
-            # Convert datetime columns to RFC3339/ISO8601 UTC strings (matching enriched predictions)
-            datetime_cols = ["prediction_time", "predicted_time"]
-            for col in datetime_cols:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors="coerce", utc=True)
-                    df[col] = df[col].dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                    df[col] = df[col].replace("NaT", None)
-
-            # Convert DataFrame to list of dicts
-            predictions = df.to_dict("records")
-
-            return predictions
+            key = (version, symbol, timeframe)
+            return self._query_predictions(start_time_str, end_time_str, [key])[key]
 
         except Exception as e:
             print(f"Error querying standard predictions: {e}")
             return []
 
-    def get_enriched_predictions(
+    @contextlib.contextmanager
+    def iter_standard_predictions(
         self,
-        start_time_str: str,
-        end_time_str: str,
+        start_time_str: str | datetime,
+        end_time_str: str | datetime,
         version: str,
         symbol: str,
         timeframe: str,
-    ) -> list[dict[str, Any]]:
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Iterator[list[dict[str, Any]]]]:
         """
-        Query enriched predictions (standard predictions + Binance enrichment data).
+        Stream standard predictions in batches, for time ranges too wide to hold in memory.
 
-        Note: Enrichment requires external data pipeline. Falls back to standard predictions.
+        Used as a context manager (``with provider.iter_standard_predictions(...) as batches:``).
+        The stream is closed on exit even if the caller stops early, so the native driver's
+        connection is released for other queries. Unlike get_standard_predictions, errors
+        propagate to the caller.
 
         Args:
-            start_time_str: Start time in ISO format
-            end_time_str: End time in ISO format
+            start_time_str: Start time in ISO format or a datetime
+            end_time_str: End time in ISO format or a datetime
             version: Prediction model version (e.g., 'V2')
             symbol: Trading symbol (e.g., 'BTC')
             timeframe: Timeframe (e.g., '1', '2', '4')
+            batch_size: Maximum rows per yielded batch
+
+        Yields:
+            Iterator over lists of prediction dictionaries (same fields as get_standard_predictions)
+        """
+        params = self._prediction_params(start_time_str, end_time_str, [(version, symbol, timeframe)])
+        batches = self._execute_iter(_STANDARD_PREDICTIONS_SQL, params, batch_size)
+
+        def labelled() -> Iterator[list[dict[str, Any]]]:
+            for batch in batches:
+                for row in batch:
+                    # Share the caller's version/symbol strings instead of a fresh copy per row
+                    row["version"], row["symbol"] = version, symbol
+                yield batch
+
+        try:
+            yield labelled()
+        finally:
+            batches.close()
+
+    def get_standard_predictions_multi(
+        self,
+        start_time_str: str | datetime,
+        end_time_str: str | datetime,
+        keys: list[tuple[str, str, str]],
+    ) -> dict[tuple[str, str, str], list[dict[str, Any]]]:
+        """
+        Query standard predictions for several (version, symbol, timeframe) keys at once.
+
+        One ClickHouse round trip instead of one per key.
+
+        Args:
+            start_time_str: Start time in ISO format or a datetime
+            end_time_str: End time in ISO format or a datetime
+            keys: List of (version, symbol, timeframe) tuples
 
         Returns:
-            List of prediction dictionaries
+            Dict mapping each requested key to its list of prediction dictionaries
         """
-        # Fall back to standard predictions (enrichment requires external data pipeline)
-        return self.get_standard_predictions(
-            start_time_str,
-            end_time_str,
-            version,
-            symbol,
-            timeframe,
-        )
+        try:
+            return self._query_predictions(start_time_str, end_time_str, keys)
+
+        except Exception as e:
+            print(f"Error querying standard predictions: {e}")
+            return {key: [] for key in keys}
+
+    async def get_standard_predictions_multi_async(
+        self,
+        start_time_str: str | datetime,
+        end_time_str: str | datetime,
+        keys: list[tuple[str, str, str]],
+    ) -> dict[tuple[str, str, str], list[dict[str, Any]]]:
+        """
+        Async variant of get_standard_predictions_multi.
+
+        Queries through the asynch pool on the caller's event loop when available,
+        otherwise runs the sync query in a worker thread.
+
+        Args:
+            start_time_str: Start time in ISO format or a datetime
+            end_time_str: End time in ISO format or a datetime
+            keys: List of (version, symbol, timeframe) tuples
+
+        Returns:
+            Dict mapping each requested key to its list of prediction dictionaries
+        """
+        if self.async_pool is None:
+            return await asyncio.to_thread(
+                self.get_standard_predictions_multi, start_time_str, end_time_str, keys
+            )
+
+        try:
+            rows = await self._execute_async(
+                _STANDARD_PREDICTIONS_SQL,
+                self._prediction_params(start_time_str, end_time_str, keys),
+            )
+            return self._group_predictions(rows, keys)
+
+        except Exception as e:
+            print(f"Error querying standard predictions: {e}")
+            return {key: [] for key in keys}
+
+    # Enriched predictions (standard predictions + Binance enrichment data) require an
+    # external data pipeline, so they resolve to standard predictions. Bound directly
+    # rather than forwarded to avoid an extra call frame per request.
+    get_enriched_predictions = get_standard_predictions
+    get_enriched_predictions_multi = get_standard_predictions_multi
+    get_enriched_predictions_multi_async = get_standard_predictions_multi_async
 
     def close(self) -> None:
         """Close ClickHouse connection."""
+        if self.native_client:
+            self.native_client.disconnect()
         if self.clickhouse_client:
             self.clickhouse_client.close()
 
+    async def aclose(self) -> None:
+        """Close the asynch pool (if started) and the sync ClickHouse connection."""
+        if self.async_pool is not None:
+            async with self._async_pool_lock:
+                if self._async_pool_started:
+                    await self.async_pool.shutdown()
+                    self._async_pool_started = False
+        self.close()
+
 
 # ============================================
 # REMOVED: Methods no longer needed
@@ -14,11 +14,97 @@ based on prediction data and manages positions with trailing stops.
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
-from typing import Any
+import asyncio
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, NamedTuple
 from zoneinfo import ZoneInfo
 
+from ipc_server._strategy_common import format_event_id, strategy_state_dict
+from ipc_server._tick_kernel import (
+    ACTION_NONE,
+    ACTION_STOP_HIT,
+    ACTION_TIME_EXIT,
+    ACTION_TRAIL_ACTIVATED,
+    tick_update,
+)
+
+# Optional C-implemented struct/JSON encoder for strategy events (falls back to plain dicts)
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+# Session filter timezone, resolved once at import
+_NY_TZ = ZoneInfo("America/New_York")
+
+# Max strategy events awaiting delivery to the UI before trailing updates are dropped
+EMIT_QUEUE_SIZE = 256
+
+# How long aclose() waits for queued strategy events to reach the UI before giving up on them
+EMIT_DRAIN_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(slots=True)
+class ActiveSignal:
+    """Open IPC position; read on every tick, so fields are slots rather than dict keys."""
+
+    direction: str  # LONG or SHORT
+    sign: int  # +1 for LONG, -1 for SHORT
+    entry_price: float
+    stop_loss: float
+    target: float
+    trailing_activation_price: float
+    entry_time: datetime  # Wall clock, for display
+    entry_ns: int  # Monotonic clock, for the per-tick time-limit check
+    prediction_data: dict[str, Any]
+
+
+class _StrategyState(NamedTuple):
+    """
+    Immutable snapshot of the strategy lines shown in the UI.
+
+    A new instance replaces the old one on every change, so snapshots can be shared by
+    queued events without defensive copies.
+    """
+
+    SL: float | None = None
+    TP: float | None = None
+    ENTRY: float | None = None
+    TSA: float | None = None
+    TRAILING_STOP_ACTIVE: bool = False
+    seq: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON wire form: {} before any update, only seq while flat."""
+        return strategy_state_dict(self.seq, self.ENTRY, self.SL, self.TP, self.TSA, self.TRAILING_STOP_ACTIVE)
+
+
+if HAS_MSGSPEC:
+
+    class StrategyEventData(msgspec.Struct):
+        """Payload of a strategy_event message."""
+
+        event_id: str
+        event_time: str
+        strategy_instance_id: str
+        instance_name: str
+        position: str
+        reason: str
+        strategy_state: dict[str, Any]
+        event_data: dict[str, Any]
+
+    class StrategyEvent(msgspec.Struct):
+        """strategy_event envelope as sent to the UI."""
+
+        data: StrategyEventData
+        type: str = "strategy_event"
+
+    _encode_event = msgspec.json.Encoder().encode
+
 
 class IPCStrategy:
     """
@@ -31,9 +117,36 @@ class IPCStrategy:
     - Enforces time limits on positions
     """
 
+    # Fixed attribute set: slot access on the per-tick path, no per-instance __dict__
+    __slots__ = (
+        "broadcast",
+        "log",
+        "instance_name",
+        "event_counter",
+        "_event_id_prefix",
+        "delta",
+        "initial_stop_loss_points",
+        "trailing_activation_offset",
+        "trailing_stop_distance",
+        "max_position_duration_hours",
+        "session_filter",
+        "_max_duration_ns",
+        "_ny_offset_by_date",
+        "active_signal",
+        "trailing_stop_active",
+        "peak_price",
+        "trailing_stop_activation_price",
+        "strategy_state",
+        "_strategy_state_dict",
+        "_state_sequence",
+        "_emit_queue",
+        "_emit_task",
+        "dropped_events",
+    )
+
     def __init__(
         self,
-        broadcast_callback: Callable[[dict[str, Any]], Any],
+        broadcast_callback: Callable[[dict[str, Any] | bytes], Any],
         log_callback: Callable[[str, str], None] | None = None,
         instance_name: str = "IPC",
         **params: Any,
@@ -42,7 +155,8 @@ class IPCStrategy:
         Initialize the IPC strategy.
 
         Args:
-            broadcast_callback: Async function to broadcast events to UI
+            broadcast_callback: Async function to broadcast events to UI. Receives a message
+                dict, or pre-encoded JSON bytes when msgspec is installed
             log_callback: Optional function for logging (level, message)
             instance_name: Strategy instance name for event tracking
             **params: Strategy parameters (delta, stop_loss, etc.)
@@ -54,6 +168,7 @@ class IPCStrategy:
         # Instance tracking
         self.instance_name = instance_name
         self.event_counter = 0  # For generating unique event IDs
+        self._event_id_prefix = f"{instance_name}_"
 
         # Strategy parameters
         self.delta = params.get("delta", 500)  # Price difference threshold
@@ -63,396 +178,421 @@ class IPCStrategy:
         self.max_position_duration_hours = params.get("max_position_duration_hours", 2)
         self.session_filter = params.get("session_filter", True)  # NY session filter
 
+        # Derived constants, built once instead of on every tick
+        self._max_duration_ns = int(self.max_position_duration_hours * 3_600_000_000_000)
+        self._ny_offset_by_date: dict[date, timedelta] = {}  # UTC date -> NY UTC offset
+
         # State
-        self.active_signal: dict[str, Any] | None = None
+        self.active_signal: ActiveSignal | None = None
         self.trailing_stop_active = False
         self.peak_price: float | None = None
         self.trailing_stop_activation_price: float | None = None
 
         # Strategy state tracking
-        self.strategy_state: dict[str, Any] = {}
+        self.strategy_state = _StrategyState()
+        # Wire form of strategy_state, rebuilt only when the snapshot is replaced
+        self._strategy_state_dict: dict[str, Any] = self.strategy_state.to_dict()
         self._state_sequence: int = 0
 
+        # Outgoing event queue, drained by _emit_loop (started on first event)
+        self._emit_queue: asyncio.Queue[dict[str, Any] | bytes] = asyncio.Queue(maxsize=EMIT_QUEUE_SIZE)
+        self._emit_task: asyncio.Task[None] | None = None
+        self.dropped_events = 0  # Trailing UPDATE events dropped because the queue was full
+
     def _default_log(self, level: str, message: str) -> None:
         """Default logging if no callback provided."""
         timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] [{level}] {message}")
 
+    @staticmethod
+    def _now_pair(now: datetime | None = None) -> tuple[str, int]:
+        """Return (ISO timestamp, epoch milliseconds) for one clock reading."""
+        if now is None:
+            now = datetime.now(UTC)
+        return now.isoformat(), int(now.timestamp() * 1000)
+
+    async def _emit_event(
+        self,
+        position: str,
+        reason: str,
+        event_data: dict[str, Any],
+        now: datetime | None = None,
+    ) -> None:
+        """
+        Refresh strategy state and broadcast one strategy_event to the UI.
+
+        Args:
+            position: Position lifecycle stage (OPEN, UPDATE, CLOSE)
+            reason: Event reason code (SIGNAL_DETECTED, STOP_LOSS_HIT, etc.)
+            event_data: Event-specific payload
+            now: Clock reading to stamp the event with (defaults to the current time)
+        """
+        # Generate unique event ID (same format as SimpleTestStrategy)
+        self.event_counter += 1
+        event_time, now_ms = self._now_pair(now)
+        event_id = format_event_id(self._event_id_prefix, self.event_counter, now_ms)
+
+        # Update strategy state (sent once, at the envelope level)
+        self._update_strategy_state()
+        strategy_state = self._strategy_state_dict
+
+        message: dict[str, Any] | bytes
+        if HAS_MSGSPEC:
+            # Encode once here; the UI server forwards the bytes without re-serializing
+            message = _encode_event(
+                StrategyEvent(
+                    StrategyEventData(
+                        event_id,
+                        event_time,
+                        self.instance_name,
+                        self.instance_name,
+                        position,
+                        reason,
+                        strategy_state,
+                        event_data,
+                    )
+                )
+            )
+        else:
+            message = {
+                "type": "strategy_event",
+                "data": {
+                    "event_id": event_id,
+                    "event_time": event_time,
+                    "strategy_instance_id": self.instance_name,
+                    "instance_name": self.instance_name,
+                    "position": position,
+                    "reason": reason,
+                    "strategy_state": strategy_state,
+                    "event_data": event_data,
+                },
+            }
+
+        # Hand off to _emit_loop so a slow UI consumer never stalls the tick handler.
+        # OPEN/CLOSE wait for queue space; trailing UPDATEs are dropped when the queue is
+        # full, since the next one carries the complete strategy_state anyway.
+        if self._emit_task is None:
+            self._emit_task = asyncio.create_task(self._emit_loop())
+        if position == "UPDATE":
+            try:
+                self._emit_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.dropped_events += 1
+        else:
+            await self._emit_queue.put(message)
+
+    async def _emit_loop(self) -> None:
+        """Deliver queued strategy events to the broadcast callback, in order."""
+        while True:
+            message = await self._emit_queue.get()
+            try:
+                await self.broadcast(message)
+            except Exception as e:
+                self.log("ERROR", f"Error broadcasting strategy event: {e}")
+            finally:
+                self._emit_queue.task_done()
+
+    async def aclose(self, timeout: float = EMIT_DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Deliver events still queued for the UI, then stop the emit loop.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain; undelivered events are dropped after that
+        """
+        task = self._emit_task
+        if task is None:
+            return
+        self._emit_task = None
+
+        try:
+            await asyncio.wait_for(self._emit_queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.log("WARNING", f"Strategy events still undelivered after {timeout}s; dropping them")
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _ny_wall_time(self, t: datetime) -> datetime:
+        """
+        Return t shifted to New York wall-clock time (only hour/weekday are meaningful).
+
+        For UTC inputs the NY offset is looked up once per UTC date instead of doing a
+        full tz conversion on every call.
+
+        Args:
+            t: Timestamp to convert
+
+        Returns:
+            Datetime whose wall-clock fields are New York local time
+        """
+        utc_offset = t.utcoffset()
+        if utc_offset is None or utc_offset:
+            return t.astimezone(_NY_TZ)
+
+        d = t.date()
+        offset = self._ny_offset_by_date.get(d)
+        if offset is None:
+            # Sampled at 12:00 UTC: after the 2am-local DST switch and inside the session
+            # window, so the cached offset is exact for every hour the filter can accept
+            offset = datetime(d.year, d.month, d.day, 12, tzinfo=UTC).astimezone(_NY_TZ).utcoffset()
+            self._ny_offset_by_date[d] = offset
+        return t + offset
+
     def _update_strategy_state(self) -> None:
-        """Update strategy_state dict with current values and increment seq."""
+        """Replace strategy_state with a snapshot of current values and increment seq."""
         self._state_sequence += 1
 
-        if not self.active_signal:
+        sig = self.active_signal
+        if not sig:
             # No position - empty state with seq
-            self.strategy_state = {"seq": self._state_sequence}
+            self.strategy_state = _StrategyState(seq=self._state_sequence)
         else:
             # Active position - full state with seq
-            self.strategy_state = {
-                "SL": self.active_signal.get("stop_loss"),
-                "TP": self.active_signal.get("target"),
-                "ENTRY": self.active_signal.get("entry_price"),
-                "TSA": self.active_signal.get("trailing_activation_price"),
-                "TRAILING_STOP_ACTIVE": self.trailing_stop_active,
-                "seq": self._state_sequence,
-            }
+            self.strategy_state = _StrategyState(
+                sig.stop_loss,
+                sig.target,
+                sig.entry_price,
+                sig.trailing_activation_price,
+                self.trailing_stop_active,
+                self._state_sequence,
+            )
+        self._strategy_state_dict = self.strategy_state.to_dict()
 
     async def check_signal_trigger(self, prediction: dict[str, Any], tick_data: dict[str, Any]) -> None:
         """
         Check if conditions met to generate new IPC signal.
 
         Args:
-            prediction: Prediction data with price predictions
-            tick_data: Current tick data with market price
+            prediction: Prediction data (prediction_price, predicted_price, prediction_time)
+            tick_data: Current tick data with market price ("p")
         """
         if self.active_signal:
             return  # Already have active signal
 
+        # Only input parsing can realistically fail, so only it is guarded; the arithmetic
+        # and event emission below run outside any try block
         try:
             # Extract prediction data from structured fields
-            current_price_pred = float(prediction.get("prediction_price", 0))
-            predicted_price = float(prediction.get("predicted_price", 0))
-            prediction_time_str = prediction.get("prediction_time", "")
-
-            # Parse prediction time
-            if prediction_time_str:
-                prediction_time = datetime.fromisoformat(prediction_time_str.replace("Z", "+00:00"))
-            else:
-                return  # No valid prediction time
-
-            # Get current tick price
-            current_tick_price = float(tick_data.get("p", 0))
-
-            # Calculate price difference
-            price_diff = predicted_price - current_price_pred
-
-            # Check delta threshold
-            if abs(price_diff) <= self.delta:
-                return  # Not significant enough
-
-            # Check time window (8am-11am ET) if session filter enabled
-            if self.session_filter:
-                ny_tz = ZoneInfo("America/New_York")
-                ny_time = prediction_time.astimezone(ny_tz)
-
-                # Check if weekday and within session hours
-                if ny_time.weekday() >= 5 or ny_time.hour < 8 or ny_time.hour >= 11:
-                    return
-
-            # Generate signal
-            direction = "LONG" if price_diff > 0 else "SHORT"
-            entry_price = current_tick_price
-
-            if direction == "LONG":
-                stop_loss = entry_price - self.initial_stop_loss_points
-                trailing_activation = entry_price + self.trailing_activation_offset
-            else:
-                stop_loss = entry_price + self.initial_stop_loss_points
-                trailing_activation = entry_price - self.trailing_activation_offset
-
-            self.active_signal = {
-                "direction": direction,
+            current_price_pred = float(prediction["prediction_price"])
+            predicted_price = float(prediction["predicted_price"])
+            prediction_time_str = prediction["prediction_time"]
+        except (KeyError, TypeError, ValueError) as e:
+            self.log("ERROR", f"Error checking signal trigger: {e}")
+            return
+
+        # Calculate price difference and check delta threshold first: most ticks are
+        # rejected here, so they skip the datetime work below
+        price_diff = predicted_price - current_price_pred
+        if abs(price_diff) <= self.delta:
+            return  # Not significant enough
+
+        if not prediction_time_str:
+            return  # No valid prediction time
+
+        try:
+            # Parse prediction time and current tick price
+            prediction_time = datetime.fromisoformat(prediction_time_str.replace("Z", "+00:00"))
+            current_tick_price = float(tick_data["p"])
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.log("ERROR", f"Error checking signal trigger: {e}")
+            return
+
+        # Check time window (8am-11am ET) if session filter enabled
+        if self.session_filter:
+            ny_time = self._ny_wall_time(prediction_time)
+
+            # Check if weekday and within session hours
+            if ny_time.weekday() >= 5 or ny_time.hour < 8 or ny_time.hour >= 11:
+                return
+
+        # Generate signal (sign is +1 for LONG, -1 for SHORT)
+        sign = 1 if price_diff > 0 else -1
+        direction = "LONG" if sign > 0 else "SHORT"
+        entry_price = current_tick_price
+
+        stop_loss = entry_price - sign * self.initial_stop_loss_points
+        trailing_activation = entry_price + sign * self.trailing_activation_offset
+
+        # entry_time stays a datetime; signal_snapshot() serializes it for the UI
+        entry_time = datetime.now(UTC)
+        entry_ns = time.monotonic_ns()
+        self.active_signal = ActiveSignal(
+            direction=direction,
+            sign=sign,
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            target=predicted_price,
+            trailing_activation_price=trailing_activation,
+            entry_time=entry_time,
+            entry_ns=entry_ns,
+            prediction_data={
+                "prediction_price": current_price_pred,
+                "predicted_price": predicted_price,
+                "prediction_time": prediction_time_str,
+            },
+        )
+
+        self.peak_price = entry_price
+        self.trailing_stop_active = False
+
+        self.log(
+            "INFO",
+            f"🚀 IPC SIGNAL GENERATED: {direction} @ {entry_price:.2f}, SL: {stop_loss:.2f}, Target: {predicted_price:.2f}",
+        )
+
+        await self._emit_event(
+            "OPEN",
+            "SIGNAL_DETECTED",
+            {
+                "signal_direction": direction,
                 "entry_price": entry_price,
-                "stop_loss": stop_loss,
-                "target": predicted_price,
+                "predicted_price": predicted_price,
+                "stop_loss_price": stop_loss,
                 "trailing_activation_price": trailing_activation,
-                "entry_time": datetime.now(UTC).isoformat(),
                 "prediction_data": {
                     "prediction_price": current_price_pred,
                     "predicted_price": predicted_price,
                     "prediction_time": prediction_time_str,
                 },
-            }
+            },
+            now=entry_time,
+        )
 
-            self.peak_price = entry_price
-            self.trailing_stop_active = False
+    async def check_position_management(self, tick_data: dict[str, Any]) -> None:
+        """
+        Manage active position (stop loss, trailing stop, time limit).
 
-            self.log(
-                "INFO",
-                f"🚀 IPC SIGNAL GENERATED: {direction} @ {entry_price:.2f}, SL: {stop_loss:.2f}, Target: {predicted_price:.2f}",
-            )
+        Args:
+            tick_data: Current tick data with market price ("p")
+        """
+        await self.check_position_management_batch((tick_data,))
 
-            # Generate unique event ID
-            self.event_counter += 1
-            event_id = (
-                f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-            )
-            event_time = datetime.now(UTC).isoformat()
+    async def check_position_management_batch(self, ticks: Sequence[dict[str, Any]]) -> None:
+        """
+        Manage active position over a burst of ticks in one coroutine frame.
 
-            # Update strategy state
-            self._update_strategy_state()
+        Ticks are applied in order; only ticks that change position state await event
+        emission, and the whole batch is skipped once no position is open.
 
-            # Broadcast signal to UI
-            await self.broadcast(
-                {
-                    "type": "strategy_event",
-                    "data": {
-                        "event_id": event_id,
-                        "event_time": event_time,
-                        "strategy_instance_id": self.instance_name,
-                        "instance_name": self.instance_name,
-                        "position": "OPEN",
-                        "reason": "SIGNAL_DETECTED",
-                        "strategy_state": self.strategy_state,
-                        "event_data": {
-                            "signal_direction": direction,
-                            "entry_price": entry_price,
-                            "predicted_price": predicted_price,
-                            "stop_loss_price": stop_loss,
-                            "trailing_activation_price": trailing_activation,
-                            "prediction_data": {
-                                "prediction_price": current_price_pred,
-                                "predicted_price": predicted_price,
-                                "prediction_time": prediction_time_str,
-                            },
-                            "strategy_state": self.strategy_state,
-                        },
-                    },
-                }
+        Args:
+            ticks: Tick data dicts with market price ("p"), oldest first
+        """
+        if not self.active_signal:
+            return
+
+        prices = []
+        for tick_data in ticks:
+            try:
+                prices.append(float(tick_data["p"]))
+            except (KeyError, TypeError, ValueError) as e:
+                self.log("ERROR", f"Error in position management: {e}")
+
+        await self.check_position_management_prices(prices)
+
+    async def check_position_management_prices(self, prices: Sequence[float]) -> None:
+        """
+        Manage active position over a burst of pre-parsed tick prices.
+
+        Args:
+            prices: Trade prices, oldest first
+        """
+        for current_price in prices:
+            sig = self.active_signal  # Re-read per tick: a previous tick may have closed it
+            if not sig:
+                return
+
+            # Time limit, stop loss and trailing stop decided by the numeric kernel;
+            # Python only branches on its action code to update state and emit events.
+            # Prices are coerced to float to match the kernel's compiled signature.
+            action, new_sl, new_peak = tick_update(
+                float(current_price),
+                sig.sign,
+                float(sig.stop_loss),
+                float(self.peak_price),
+                self.trailing_stop_active,
+                float(sig.trailing_activation_price),
+                float(self.trailing_stop_distance),
+                time.monotonic_ns() - sig.entry_ns,
+                self._max_duration_ns,
             )
 
-        except Exception as e:
-            self.log("ERROR", f"Error checking signal trigger: {e}")
+            if action != ACTION_NONE:
+                await self._apply_tick_action(action, current_price, new_sl, new_peak)
 
-    async def check_position_management(self, tick_data: dict[str, Any]) -> None:
+    async def _apply_tick_action(self, action: int, current_price: float, new_sl: float, new_peak: float) -> None:
         """
-        Manage active position (stop loss, trailing stop, time limit).
+        Update position state and emit the event for a non-trivial tick_update result.
 
         Args:
-            tick_data: Current tick data with market price
+            action: Action code from tick_update (never ACTION_NONE)
+            current_price: Tick price that produced the action
+            new_sl: Stop loss returned by tick_update
+            new_peak: Peak price returned by tick_update
         """
-        if not self.active_signal:
-            return
+        sig = self.active_signal
+        direction = sig.direction
+        sign = sig.sign
+        entry_price = sig.entry_price
 
-        try:
-            current_price = float(tick_data.get("p", 0))
-            direction = self.active_signal["direction"]
-            entry_price = self.active_signal["entry_price"]
-            stop_loss = self.active_signal["stop_loss"]
-
-            # Check time limit
-            entry_time = datetime.fromisoformat(self.active_signal["entry_time"].replace("Z", "+00:00"))
-            time_since_entry = datetime.now(UTC) - entry_time
-            if time_since_entry > timedelta(hours=self.max_position_duration_hours):
-                pnl = current_price - entry_price if direction == "LONG" else entry_price - current_price
-                pnl_pct = (pnl / entry_price) * 100
-
-                self.log(
-                    "INFO",
-                    f"⏰ TIME LIMIT HIT: {direction} position closed. PNL: ${pnl:.2f} ({pnl_pct:.2f}%)",
-                )
+        if action == ACTION_TIME_EXIT:
+            pnl = sign * (current_price - entry_price)
+            pnl_pct = (pnl / entry_price) * 100
 
-                # Generate unique event ID
-                self.event_counter += 1
-                event_id = (
-                    f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-                )
-                event_time = datetime.now(UTC).isoformat()
-
-                # Reset state
-                self.active_signal = None
-                self.trailing_stop_active = False
-                self._update_strategy_state()  # Updates to empty state with seq
-
-                await self.broadcast(
-                    {
-                        "type": "strategy_event",
-                        "data": {
-                            "event_id": event_id,
-                            "event_time": event_time,
-                            "strategy_instance_id": self.instance_name,
-                            "instance_name": self.instance_name,
-                            "position": "CLOSE",
-                            "reason": "POSITION_TIME_LIMIT_HIT",
-                            "strategy_state": self.strategy_state,
-                            "event_data": {
-                                "direction": direction,
-                                "entry_price": entry_price,
-                                "current_price": current_price,
-                                "pnl": pnl,
-                                "pnl_percentage": pnl_pct,
-                                "strategy_state": self.strategy_state,
-                            },
-                        },
-                    }
-                )
+            self.log(
+                "INFO",
+                f"⏰ TIME LIMIT HIT: {direction} position closed. PNL: ${pnl:.2f} ({pnl_pct:.2f}%)",
+            )
 
-                return
+            # Reset state
+            self.active_signal = None
+            self.trailing_stop_active = False
 
-            # Check stop loss and trailing stop
-            if direction == "LONG":
-                if current_price <= stop_loss:
-                    await self.close_position(current_price, "STOP_LOSS_HIT")
-                    return
-
-                # Trailing stop logic
-                if self.trailing_stop_active:
-                    if current_price > self.peak_price:
-                        self.peak_price = current_price
-                        new_sl = self.peak_price - self.trailing_stop_distance
-                        self.active_signal["stop_loss"] = new_sl
-
-                        # Generate unique event ID
-                        self.event_counter += 1
-                        event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-                        event_time = datetime.now(UTC).isoformat()
-
-                        # Update strategy state
-                        self._update_strategy_state()
-
-                        await self.broadcast(
-                            {
-                                "type": "strategy_event",
-                                "data": {
-                                    "event_id": event_id,
-                                    "event_time": event_time,
-                                    "strategy_instance_id": self.instance_name,
-                                    "instance_name": self.instance_name,
-                                    "position": "UPDATE",
-                                    "reason": "TRAILING_STOP_UPDATED",
-                                    "strategy_state": self.strategy_state,
-                                    "event_data": {
-                                        "direction": direction,
-                                        "entry_price": entry_price,
-                                        "stop_loss_price": new_sl,
-                                        "peak_price": self.peak_price,
-                                        "trailing_stop_activated": True,
-                                        "current_price": current_price,
-                                        "strategy_state": self.strategy_state,
-                                    },
-                                },
-                            }
-                        )
-                elif current_price >= self.active_signal["trailing_activation_price"]:
-                    self.trailing_stop_active = True
-                    self.peak_price = current_price
-                    new_sl = self.peak_price - self.trailing_stop_distance
-                    self.active_signal["stop_loss"] = new_sl
-
-                    self.log(
-                        "INFO",
-                        f"🎯 TRAILING STOP ACTIVATED: Peak ${self.peak_price:.2f}, New SL ${new_sl:.2f}",
-                    )
+            await self._emit_event(
+                "CLOSE",
+                "POSITION_TIME_LIMIT_HIT",
+                {
+                    "direction": direction,
+                    "entry_price": entry_price,
+                    "current_price": current_price,
+                    "pnl": pnl,
+                    "pnl_percentage": pnl_pct,
+                },
+            )
+            return
 
-                    # Generate unique event ID
-                    self.event_counter += 1
-                    event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-                    event_time = datetime.now(UTC).isoformat()
-
-                    # Update strategy state
-                    self._update_strategy_state()
-
-                    await self.broadcast(
-                        {
-                            "type": "strategy_event",
-                            "data": {
-                                "event_id": event_id,
-                                "event_time": event_time,
-                                "strategy_instance_id": self.instance_name,
-                                "instance_name": self.instance_name,
-                                "position": "UPDATE",
-                                "reason": "TRAILING_STOP_ACTIVATED",
-                                "strategy_state": self.strategy_state,
-                                "event_data": {
-                                    "direction": direction,
-                                    "entry_price": entry_price,
-                                    "stop_loss_price": new_sl,
-                                    "peak_price": self.peak_price,
-                                    "trailing_stop_activated": True,
-                                    "current_price": current_price,
-                                    "strategy_state": self.strategy_state,
-                                },
-                            },
-                        }
-                    )
+        if action == ACTION_STOP_HIT:
+            await self.close_position(current_price, "STOP_LOSS_HIT")
+            return
 
-            else:  # SHORT
-                if current_price >= stop_loss:
-                    await self.close_position(current_price, "STOP_LOSS_HIT")
-                    return
-
-                # Trailing stop logic for SHORT
-                if self.trailing_stop_active:
-                    if current_price < self.peak_price:
-                        self.peak_price = current_price
-                        new_sl = self.peak_price + self.trailing_stop_distance
-                        self.active_signal["stop_loss"] = new_sl
-
-                        # Generate unique event ID
-                        self.event_counter += 1
-                        event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-                        event_time = datetime.now(UTC).isoformat()
-
-                        # Update strategy state
-                        self._update_strategy_state()
-
-                        await self.broadcast(
-                            {
-                                "type": "strategy_event",
-                                "data": {
-                                    "event_id": event_id,
-                                    "event_time": event_time,
-                                    "strategy_instance_id": self.instance_name,
-                                    "instance_name": self.instance_name,
-                                    "position": "UPDATE",
-                                    "reason": "TRAILING_STOP_UPDATED",
-                                    "strategy_state": self.strategy_state,
-                                    "event_data": {
-                                        "direction": direction,
-                                        "entry_price": entry_price,
-                                        "stop_loss_price": new_sl,
-                                        "peak_price": self.peak_price,
-                                        "trailing_stop_activated": True,
-                                        "current_price": current_price,
-                                        "strategy_state": self.strategy_state,
-                                    },
-                                },
-                            }
-                        )
-                elif current_price <= self.active_signal["trailing_activation_price"]:
-                    self.trailing_stop_active = True
-                    self.peak_price = current_price
-                    new_sl = self.peak_price + self.trailing_stop_distance
-                    self.active_signal["stop_loss"] = new_sl
-
-                    self.log(
-                        "INFO",
-                        f"🎯 TRAILING STOP ACTIVATED: Peak ${self.peak_price:.2f}, New SL ${new_sl:.2f}",
-                    )
+        # Trailing stop updated or activated
+        self.peak_price = new_peak
+        sig.stop_loss = new_sl
 
-                    # Generate unique event ID
-                    self.event_counter += 1
-                    event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-                    event_time = datetime.now(UTC).isoformat()
-
-                    # Update strategy state
-                    self._update_strategy_state()
-
-                    await self.broadcast(
-                        {
-                            "type": "strategy_event",
-                            "data": {
-                                "event_id": event_id,
-                                "event_time": event_time,
-                                "strategy_instance_id": self.instance_name,
-                                "instance_name": self.instance_name,
-                                "position": "UPDATE",
-                                "reason": "TRAILING_STOP_ACTIVATED",
-                                "strategy_state": self.strategy_state,
-                                "event_data": {
-                                    "direction": direction,
-                                    "entry_price": entry_price,
-                                    "stop_loss_price": new_sl,
-                                    "peak_price": self.peak_price,
-                                    "trailing_stop_activated": True,
-                                    "current_price": current_price,
-                                    "strategy_state": self.strategy_state,
-                                },
-                            },
-                        }
-                    )
+        if action == ACTION_TRAIL_ACTIVATED:
+            self.trailing_stop_active = True
+            reason = "TRAILING_STOP_ACTIVATED"
+            self.log(
+                "INFO",
+                f"🎯 TRAILING STOP ACTIVATED: Peak ${new_peak:.2f}, New SL ${new_sl:.2f}",
+            )
+        else:
+            reason = "TRAILING_STOP_UPDATED"
 
-        except Exception as e:
-            self.log("ERROR", f"Error in position management: {e}")
+        await self._emit_event(
+            "UPDATE",
+            reason,
+            {
+                "direction": direction,
+                "entry_price": entry_price,
+                "stop_loss_price": new_sl,
+                "peak_price": new_peak,
+                "trailing_stop_activated": True,
+                "current_price": current_price,
+            },
+        )
 
     async def close_position(self, exit_price: float, reason: str) -> None:
         """
@@ -462,14 +602,15 @@ class IPCStrategy:
             exit_price: Price at which position is closed
             reason: Reason for closing (STOP_LOSS_HIT, etc.)
         """
-        if not self.active_signal:
+        sig = self.active_signal
+        if not sig:
             return
 
-        direction = self.active_signal["direction"]
-        entry_price = self.active_signal["entry_price"]
-        stop_loss = self.active_signal["stop_loss"]
+        direction = sig.direction
+        entry_price = sig.entry_price
+        stop_loss = sig.stop_loss
 
-        pnl = exit_price - entry_price if direction == "LONG" else entry_price - exit_price
+        pnl = sig.sign * (exit_price - entry_price)
         pnl_pct = (pnl / entry_price) * 100
 
         self.log(
@@ -477,41 +618,50 @@ class IPCStrategy:
             f"🛑 {reason}: {direction} position closed @ ${exit_price:.2f}. PNL: ${pnl:.2f} ({pnl_pct:.2f}%)",
         )
 
-        # Generate unique event ID
-        self.event_counter += 1
-        event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-        event_time = datetime.now(UTC).isoformat()
-
         # Reset state
         self.active_signal = None
         self.trailing_stop_active = False
         self.peak_price = None
-        self._update_strategy_state()  # Updates to empty state with seq
 
-        await self.broadcast(
+        await self._emit_event(
+            "CLOSE",
+            reason,
             {
-                "type": "strategy_event",
-                "data": {
-                    "event_id": event_id,
-                    "event_time": event_time,
-                    "strategy_instance_id": self.instance_name,
-                    "instance_name": self.instance_name,
-                    "position": "CLOSE",
-                    "reason": reason,
-                    "strategy_state": self.strategy_state,
-                    "event_data": {
-                        "direction": direction,
-                        "entry_price": entry_price,
-                        "stop_loss_price": stop_loss,
-                        "current_price": exit_price,
-                        "pnl": pnl,
-                        "pnl_percentage": pnl_pct,
-                        "strategy_state": self.strategy_state,
-                    },
-                },
-            }
+                "direction": direction,
+                "entry_price": entry_price,
+                "stop_loss_price": stop_loss,
+                "current_price": exit_price,
+                "pnl": pnl,
+                "pnl_percentage": pnl_pct,
+            },
         )
 
-    def get_strategy_state(self) -> dict[str, Any]:
-        """Return current strategy state for UI display."""
-        return self.strategy_state.copy()
+    def signal_snapshot(self) -> dict[str, Any] | None:
+        """
+        Return the active signal in JSON-serializable form (entry_time as ISO string).
+
+        Only the keys of the original dict-based signal are included; sign and entry_ns are
+        internal to the tick path and stay out of the UI payload.
+        """
+        sig = self.active_signal
+        if not sig:
+            return None
+        return {
+            "direction": sig.direction,
+            "entry_price": sig.entry_price,
+            "stop_loss": sig.stop_loss,
+            "target": sig.target,
+            "trailing_activation_price": sig.trailing_activation_price,
+            "entry_time": sig.entry_time.isoformat(),
+            "prediction_data": dict(sig.prediction_data),
+        }
+
+    def get_strategy_state(self) -> Mapping[str, Any]:
+        """
+        Return current strategy state for UI display.
+
+        The mapping is read-only by contract and returned without copying: it is rebuilt from
+        the immutable snapshot whenever _update_strategy_state replaces it, never mutated in place.
+        Callers that need to modify it must take their own dict(...) copy.
+        """
+        return self._strategy_state_dict
@@ -21,10 +21,17 @@ No complex infrastructure required - just HTTP/WebSocket.
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import os
 import socket
+import time
+import traceback
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any, LiteralString
 from zoneinfo import ZoneInfo
 
@@ -32,14 +39,254 @@ import ssl
 
 import aiohttp
 import websockets
-from aiohttp import web
+from aiohttp import WSMsgType, web
 from dotenv import load_dotenv
 
+# Optional fast JSON encoder/decoder (falls back to the json module)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional vectorized math for backtest trade conversion (falls back to a Python loop)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Optional faster event loop (libuv); not available on Windows
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Create SSL context that doesn't verify certificates (for Mac Python SSL issues)
 SSL_CONTEXT = ssl.create_default_context()
 SSL_CONTEXT.check_hostname = False
 SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 
+# UI broadcast fan-out: each client gets a bounded queue drained by its own writer task;
+# a client whose send doesn't complete within the timeout is disconnected
+WS_CLIENT_QUEUE_SIZE = 64
+WS_SEND_TIMEOUT_SECONDS = 2.0
+
+# Tick prices buffered for IPC position management while the strategy is busy (e.g. awaiting a
+# CLOSE emit); beyond this, later prices are coalesced into their low/high/last so memory stays
+# bounded without losing a stop-crossing extreme
+STRATEGY_TICK_QUEUE_SIZE = 4096
+
+# Max concurrent outbound HTTP connections on the shared client session, in total and per host
+# (so a burst of klines proxy requests can't starve the validator/Oracle polls)
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 16
+
+# Idle keep-alive for pooled connections; outlives the 30s validator poll interval so every
+# poll reuses the same loopback connection
+HTTP_KEEPALIVE_SECONDS = 120
+
+# Binance klines proxy cache. Ranges that include the still-open candle change with every
+# trade, so they're only reused briefly; fully closed ranges are immutable.
+KLINES_CACHE_TTL_SECONDS = 2.0
+KLINES_HISTORICAL_CACHE_TTL_SECONDS = 60.0
+KLINES_CACHE_MAX_ENTRIES = 256
+
+# Seconds per Binance kline interval unit ("1m", "4h", "1d", "1w", "1M")
+_KLINE_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "M": 2678400}
+
+# Predictions are generated on 5-minute wall-clock boundaries (:00, :05, :10, ...). Polls are
+# scheduled a little after each boundary; if a boundary poll finds no new signal-timeframe row,
+# retry at these offsets (seconds after the boundary poll) before waiting for the next boundary.
+PREDICTION_BOUNDARY_SECONDS = 300
+CLICKHOUSE_POLL_OFFSET_SECONDS = 10
+ORACLE_POLL_OFFSET_SECONDS = 45
+PREDICTION_RETRY_DELAYS_SECONDS = (30, 60)
+
+# Prediction timeframes (hours) polled and broadcast to the UI
+PREDICTION_TIMEFRAMES = (1, 2, 4)
+
+# Timeframe (hours) whose new predictions trigger IPC signal checks
+SIGNAL_TIMEFRAME = 2
+
+# Numeric severities for log-level filtering (unknown levels are always printed)
+_LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# Binance enrichment fields appended to an enriched prediction's UI record
+ENRICHMENT_FIELDS = (
+    "binance_trade_price_prediction",
+    "binance_trade_price_predicted",
+    "binance_trade_time_prediction",
+    "binance_trade_time_predicted",
+    "diff_at_prediction_time",
+    "diff_at_predicted_time",
+)
+
+# UI page; read once at startup and revalidated by browsers via ETag
+UI_INDEX_PATH = Path("./ui/chart.html")
+UI_INDEX_MAX_AGE_SECONDS = 60
+
+# Oracle playbook trade times are New York wall-clock; ZoneInfo loads tz data, so build it once
+_NY_TZ = ZoneInfo("America/New_York")
+
+# Oracle playbook trade date/time layout ("YYYY-MM-DD" + "HH:MM", New York wall clock)
+_NYC_ENTRY_FORMAT = "%Y-%m-%d %H:%M"
+
+# Distinct (date, time) pairs kept by the playbook entry-time cache (many trades share a date)
+PLAYBOOK_TIME_CACHE_SIZE = 8192
+
+# Distinct epoch timestamps kept by the ISO-string cache (Oracle prediction times recur every poll)
+EPOCH_ISO_CACHE_SIZE = 4096
+
+@dataclass(slots=True)
+class _BacktestTrade:
+    """One Tracer backtest trade; field names (and order) are the JSON keys the UI reads."""
+
+    id: Any
+    direction: str
+    entryTime: int
+    entryTimeISO: str | None
+    exitTime: int
+    exitTimeISO: str | None
+    entryPrice: float
+    exitPrice: float
+    predictedPrice: float
+    delta: float
+    pnl: float  # Dollar PnL per contract
+    pnlPercent: float  # Percentage PnL
+    pnlTotal: float  # Total PnL with contracts
+    result: str
+    indicators: dict[str, Any]
+    timeNYC: str
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for NumPy values and dataclasses (orjson serializes both natively)."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (UI messages are sent as text frames: the UI JSON.parses event.data)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+@functools.lru_cache(maxsize=EPOCH_ISO_CACHE_SIZE)
+def _epoch_to_iso(timestamp: float) -> str:
+    """Convert epoch seconds to a UTC ISO8601 string (cached per timestamp)."""
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+@functools.lru_cache(maxsize=2)
+def _utc_second_iso(seconds: int) -> str:
+    """ISO8601 date/time prefix ("YYYY-MM-DDTHH:MM:SS") for an epoch second (cached for the current second)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _iso_now() -> str:
+    """Current UTC time in datetime.isoformat() layout, without building a datetime."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_utc_second_iso(seconds)}.{nanos // 1000:06d}+00:00"
+
+
+def _epochs_to_iso(timestamps: list[int]) -> list[str | None]:
+    """Batch form of _epoch_to_iso for whole-second timestamps (None where the timestamp is 0)."""
+    if HAS_NUMPY and timestamps:
+        # One vectorized datetime64 formatting pass instead of a datetime per timestamp
+        naive = np.datetime_as_string(np.asarray(timestamps, dtype="datetime64[s]"), unit="s").tolist()
+        return [f"{iso}+00:00" if ts else None for ts, iso in zip(timestamps, naive)]
+    return [_epoch_to_iso(ts) if ts else None for ts in timestamps]
+
+
+@functools.lru_cache(maxsize=PLAYBOOK_TIME_CACHE_SIZE)
+def _nyc_entry_time(date_str: str, time_nyc: str) -> tuple[int, str]:
+    """
+    Convert a New York wall-clock date ("YYYY-MM-DD") and time ("HH:MM") to epoch seconds
+    and a UTC ISO8601 string (cached per pair).
+    """
+    canonical = len(date_str) == 10 and len(time_nyc) == 5
+    if canonical and date_str[4] == date_str[7] == "-" and time_nyc[2] == ":":
+        # Zero-padded layout Oracle sends: slice the fields directly (invalid values still raise ValueError)
+        nyc_dt = datetime(
+            int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]),
+            int(time_nyc[:2]), int(time_nyc[3:]), tzinfo=_NY_TZ,
+        )
+    else:
+        nyc_dt = datetime.strptime(f"{date_str} {time_nyc}", _NYC_ENTRY_FORMAT).replace(tzinfo=_NY_TZ)
+    return int(nyc_dt.timestamp()), nyc_dt.astimezone(UTC).isoformat()
+
+
+def _playbook_pnl_percents(oracle_trades: list[dict[str, Any]]) -> tuple[list[float], float]:
+    """
+    Per-trade PnL percentage from entry/exit prices, rounded to 2 decimals.
+
+    Args:
+        oracle_trades: Oracle playbook trades ("entry", "exit", "direction")
+
+    Returns:
+        (PnL percent per trade in order (0 where the entry price is missing or zero),
+        sum of those rounded percentages)
+    """
+    if HAS_NUMPY and oracle_trades:
+        count = len(oracle_trades)
+        entry = np.fromiter((t.get("entry") or 0 for t in oracle_trades), dtype=np.float64, count=count)
+        exit_ = np.fromiter((t.get("exit") or 0 for t in oracle_trades), dtype=np.float64, count=count)
+        is_long = np.fromiter(
+            (t.get("direction", "LONG") == "LONG" for t in oracle_trades), dtype=np.bool_, count=count
+        )
+        has_entry = entry != 0
+        pnl = np.where(is_long, exit_ - entry, entry - exit_) / np.where(has_entry, entry, 1.0) * 100
+        pnl = np.where(has_entry, pnl, 0.0)
+
+        # Rounded once at the output boundary with Python's round() (correctly rounded, as the
+        # per-trade path below), not np.round's scale-then-round-half-even
+        pnl_percents = [round(pnl_percent, 2) for pnl_percent in pnl.tolist()]
+        return pnl_percents, sum(pnl_percents)
+
+    pnl_percents = []
+    for t in oracle_trades:
+        entry_price = t.get("entry", 0)
+        exit_price = t.get("exit", 0)
+        if entry_price:
+            if t.get("direction", "LONG") == "LONG":
+                pnl_percent = ((exit_price - entry_price) / entry_price) * 100
+            else:  # SHORT
+                pnl_percent = ((entry_price - exit_price) / entry_price) * 100
+        else:
+            pnl_percent = 0
+        pnl_percents.append(round(pnl_percent, 2))
+    return pnl_percents, sum(pnl_percents)
+
+
+# Parse JSON text/bytes (upstream API bodies, Binance stream messages)
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON HTTP response, encoding straight to bytes (orjson when available)."""
+    return web.Response(body=_json_dumps(data), status=status, content_type="application/json")
+
+
+def _seconds_until_next_boundary(offset_seconds: float, period_seconds: int = PREDICTION_BOUNDARY_SECONDS) -> float:
+    """Seconds until the next wall-clock period boundary plus offset (e.g. 10:05:10 for offset 10).
+
+    Args:
+        offset_seconds: Delay after the boundary at which to fire
+        period_seconds: Boundary period (default: 5 minutes)
+
+    Returns:
+        Seconds to sleep (always > 0; exactly on the mark schedules the following one)
+    """
+    now = time.time()
+    next_mark = ((now - offset_seconds) // period_seconds + 1) * period_seconds + offset_seconds
+    return next_mark - now
+
 # Try to import EAIPredictionProvider, but make it optional
 # (requires ClickHouse and src.Data.db.ClickHouseClient)
 try:
@@ -74,12 +321,14 @@ class IPCUIServer:
     ):
         self.port = port
         self.log_level = log_level
+        self._min_log_level = _LOG_LEVELS.get(log_level.upper(), _LOG_LEVELS["INFO"])
         self.test_mode = test_mode
         self.use_standard_predictions = use_standard_predictions
         self.app = web.Application()
 
-        # WebSocket clients (UI connections)
-        self.ws_clients: set[web.WebSocketResponse] = set()
+        # WebSocket clients (UI connections), each with its outgoing message queue
+        self.ws_clients: dict[web.WebSocketResponse, asyncio.Queue[bytes]] = {}
+        self._closing_tasks: set[asyncio.Task] = set()
 
         # In-memory state
         self.latest_tick: dict[str, Any] | None = None
@@ -87,6 +336,21 @@ class IPCUIServer:
         # Binance WebSocket
         self.binance_ws_task: asyncio.Task | None = None
 
+        # Shared outbound HTTP session for proxy handlers and pollers (created in start())
+        self.http_session: aiohttp.ClientSession | None = None
+
+        # Binance klines responses: normalized query -> (expiry monotonic time, raw body)
+        self._klines_cache: dict[tuple[tuple[str, str], ...], tuple[float, bytes]] = {}
+
+        # Ticks awaiting IPC position management; drained in batches by strategy_tick_task
+        self.strategy_tick_queue: asyncio.Queue[float] = asyncio.Queue(maxsize=STRATEGY_TICK_QUEUE_SIZE)
+        self.strategy_tick_task: asyncio.Task | None = None
+        # Prices that arrived while the queue was full, coalesced as [low, high, last] plus whether
+        # the low was reached after the high; appended to the next batch by the tick loop
+        self._tick_overflow: list[float] = []
+        self._tick_overflow_low_later = False
+        self._tick_overflow_count = 0
+
         # EAI Prediction Provider (read-only from ClickHouse)
         self.prediction_provider: EAIPredictionProvider | None = None
 
@@ -99,31 +363,109 @@ class IPCUIServer:
 
         # ClickHouse config (for prediction provider)
         self.clickhouse_host = os.getenv("CLICKHOUSE_HOST", "localhost")
-        self.clickhouse_port = int(os.getenv("CLICKHOUSE_PORT", "9100"))  # Native protocol port
+        self.clickhouse_port = int(os.getenv("CLICKHOUSE_PORT", "9100"))  # HTTP interface port
         self.clickhouse_user = os.getenv("CLICKHOUSE_USER", "default")
         self.clickhouse_password = os.getenv("CLICKHOUSE_PASSWORD", "")
         self.clickhouse_database = os.getenv("CLICKHOUSE_DATABASE", "default")
+        # Optional native TCP protocol port (e.g. 9000); switches to clickhouse-driver when installed
+        native_port = os.getenv("CLICKHOUSE_NATIVE_PORT")
+        self.clickhouse_native_port = int(native_port) if native_port else None
+        # Optional server-side query cache; requires ClickHouse 23.1+ so it stays off by default
+        self.clickhouse_query_cache = os.getenv("CLICKHOUSE_QUERY_CACHE", "").lower() in ("1", "true", "yes")
 
         # Strategy instance (will be initialized in start())
         self.strategy: IPCStrategy | SimpleTestStrategy | None = None
+        # Strategy hooks bound once in start() so the hot paths skip per-message type dispatch
+        self._process_tick: Callable[[float], Awaitable[None]] | None = None
+        self._signal_trigger: Callable[[dict[str, Any], dict[str, Any]], Awaitable[None]] | None = None
+        self._suppress_heartbeat: Callable[[], bool] | None = None
+        self._get_strategy_state: Callable[[], Any] | None = None
         self.heartbeat_task: asyncio.Task | None = None
         self.v23_poll_task: asyncio.Task | None = None
         self.runtime_id: str = ""  # Will be set in start()
+        # Encoded heartbeat prefix up to "heartbeat_at" (instance name/id are fixed after start())
+        self._heartbeat_prefix = b""
+        # Last strategy state object seen by the heartbeat and its encoded JSON
+        self._heartbeat_state: Any = None
+        self._heartbeat_state_json = b"{}"
+
+        # Pre-encoded bodies for static UI-compatibility endpoints. The mode body embeds a
+        # timestamp, so it's rebuilt at most once per wall-clock second.
+        self._instances_body = _json_dumps(["TestStrategy"] if test_mode else ["IPC"])
+        self._mode_body = b""
+        self._mode_body_second = -1
+        self._index_body = b""
+        self._index_etag = ""
 
     # ============================================
     # LOGGING
     # ============================================
 
-    def log(self, level: str, message: str | LiteralString, **kwargs: Any) -> None:
-        """Simple logging."""
+    def log(self, level: str, message: str | LiteralString, *args: Any, **kwargs: Any) -> None:
+        """Simple logging, filtered by log_level (positional args are %-formatted only if printed)."""
+        if _LOG_LEVELS.get(level, _LOG_LEVELS["CRITICAL"]) < self._min_log_level:
+            return
+        if args:
+            message = message % args
         timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
         extra = f" {kwargs}" if kwargs else ""
         print(f"[{timestamp}] [{level}] {message}{extra}")
 
+    def _log_enabled(self, level: str) -> bool:
+        """Whether a line at level would be printed (guards log arguments costly to build)."""
+        return _LOG_LEVELS.get(level, _LOG_LEVELS["CRITICAL"]) >= self._min_log_level
+
     # ============================================
     # 1. BINANCE TICK PROXY
     # ============================================
 
+    async def _queue_strategy_tick(self, price: float) -> None:
+        """Queue a tick price for batched IPC position management (see _strategy_tick_loop)."""
+        queue = self.strategy_tick_queue
+        if not queue.full():
+            queue.put_nowait(price)
+            return
+
+        # Strategy stalled: no price is dropped outright, the overflow keeps its extremes and last
+        overflow = self._tick_overflow
+        self._tick_overflow_count += 1
+        if not overflow:
+            overflow.extend((price, price, price))
+            self._tick_overflow_low_later = False
+            return
+        if price < overflow[0]:
+            overflow[0] = price
+            self._tick_overflow_low_later = True
+        elif price > overflow[1]:
+            overflow[1] = price
+            self._tick_overflow_low_later = False
+        overflow[2] = price
+
+    async def _strategy_tick_loop(self) -> None:
+        """Feed queued tick prices to the IPC strategy, draining each burst into one batch call."""
+        while True:
+            prices = [await self.strategy_tick_queue.get()]
+            while not self.strategy_tick_queue.empty():
+                prices.append(self.strategy_tick_queue.get_nowait())
+
+            # Overflow only builds up while the queue is full, so it is newer than every queued price;
+            # its extremes go in the order they were reached, followed by the last price
+            overflow = self._tick_overflow
+            if overflow:
+                low, high, last = overflow
+                prices.extend((high, low, last) if self._tick_overflow_low_later else (low, high, last))
+                self.log(
+                    "WARNING", "Strategy fell behind the tick feed: coalesced %d prices into low/high/last",
+                    self._tick_overflow_count,
+                )
+                overflow.clear()
+                self._tick_overflow_count = 0
+
+            try:
+                await self.strategy.check_position_management_prices(prices)
+            except Exception as e:
+                self.log("ERROR", f"Error in strategy tick processing: {e}")
+
     async def start_binance_tick_stream(self):
         """Connect to Binance WebSocket and relay ticks to UI."""
         uri = "wss://stream.binance.com:9443/ws/btcusdt@trade"
@@ -137,22 +479,19 @@ class IPCUIServer:
 
                     async for message in ws:
                         try:
-                            tick_data = json.loads(message)
+                            tick_data = _json_loads(message)
                             self.latest_tick = tick_data
 
-                            # Broadcast to UI
-                            await self.broadcast({"type": "trade", "data": tick_data})
+                            # Broadcast to UI (skip building the envelope when nobody is watching)
+                            if self.ws_clients:
+                                await self.broadcast({"type": "trade", "data": tick_data})
 
-                            # Forward tick to strategy
-                            if self.strategy:
-                                # For test strategy, track current price
-                                if isinstance(self.strategy, SimpleTestStrategy):
-                                    await self.strategy.process_tick(tick_data)
-                                # For IPC strategy, check position management
-                                elif isinstance(self.strategy, IPCStrategy):
-                                    await self.strategy.check_position_management(tick_data)
+                            # Forward tick to strategy (hook bound in start()) as a pre-parsed
+                            # price; the raw dict is only kept for the UI and signal checks
+                            if self._process_tick is not None:
+                                await self._process_tick(float(tick_data["p"]))
 
-                        except json.JSONDecodeError as e:
+                        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
                             self.log("ERROR", f"Failed to parse Binance message: {e}")
 
             except Exception as e:
@@ -164,62 +503,92 @@ class IPCUIServer:
     # 2. BINANCE HISTORY PROXY
     # ============================================
 
+    @staticmethod
+    def _klines_cache_ttl(params: Mapping[str, str]) -> float:
+        """TTL for a klines response: long once the requested range's last candle has closed."""
+        try:
+            interval = params.get("interval", "")
+            interval_seconds = int(interval[:-1]) * _KLINE_UNIT_SECONDS[interval[-1]]
+            end_seconds = int(params["endTime"]) / 1000
+        except (KeyError, ValueError, IndexError):
+            return KLINES_CACHE_TTL_SECONDS
+        if end_seconds + interval_seconds < time.time():
+            return KLINES_HISTORICAL_CACHE_TTL_SECONDS
+        return KLINES_CACHE_TTL_SECONDS
+
     async def handle_binance_klines(self, request: web.Request) -> web.Response:
-        """Proxy Binance klines API."""
+        """Proxy Binance klines API (identical queries are served from a short-lived cache)."""
         try:
-            params = dict(request.query)
-
-            connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(
-                    "https://api.binance.com/api/v3/klines",
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return web.json_response(data)
-                    else:
-                        error_text = await resp.text()
-                        self.log("ERROR", f"Binance API error: {resp.status} - {error_text}")
-                        return web.json_response(
-                            {"error": f"Binance API error: {resp.status}"}, status=resp.status
-                        )
+            # Forwarded as-is (MultiDictProxy): no copy, repeated keys preserved
+            params = request.query
+
+            cache_key = tuple(sorted(params.items()))
+            cached = self._klines_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return web.Response(body=cached[1], content_type="application/json")
+
+            async with self.http_session.get(
+                "https://api.binance.com/api/v3/klines",
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    # Raw upstream bytes are cached and returned as-is (no parse/re-encode)
+                    body = await resp.read()
+                    if len(self._klines_cache) >= KLINES_CACHE_MAX_ENTRIES:
+                        now = time.monotonic()
+                        for key in [k for k, (expiry, _) in self._klines_cache.items() if expiry <= now]:
+                            del self._klines_cache[key]
+                        if len(self._klines_cache) >= KLINES_CACHE_MAX_ENTRIES:
+                            del self._klines_cache[next(iter(self._klines_cache))]
+                    self._klines_cache[cache_key] = (time.monotonic() + self._klines_cache_ttl(params), body)
+                    return web.Response(body=body, content_type="application/json")
+                else:
+                    error_text = await resp.text()
+                    self.log("ERROR", f"Binance API error: {resp.status} - {error_text}")
+                    return _json_response(
+                        {"error": f"Binance API error: {resp.status}"}, status=resp.status
+                    )
 
         except Exception as e:
             self.log("ERROR", f"Error proxying Binance klines: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
     async def handle_binance_aggtrades(self, request: web.Request) -> web.Response:
         """Proxy Binance aggTrades API."""
         try:
-            params = dict(request.query)
-
-            connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(
-                    "https://api.binance.com/api/v3/aggTrades",
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return web.json_response(data)
-                    else:
-                        return web.json_response(
-                            {"error": f"Binance API error: {resp.status}"}, status=resp.status
-                        )
+            async with self.http_session.get(
+                "https://api.binance.com/api/v3/aggTrades",
+                params=request.query,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    # Pass the upstream JSON through untouched (no parse/re-encode)
+                    return web.Response(body=await resp.read(), content_type="application/json")
+                else:
+                    return _json_response(
+                        {"error": f"Binance API error: {resp.status}"}, status=resp.status
+                    )
 
         except Exception as e:
             self.log("ERROR", f"Error proxying Binance aggTrades: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
     # ============================================
     # 3. EAI PREDICTION PROVIDER (READ-ONLY)
     # ============================================
 
     async def poll_latest_predictions(self):
-        """Poll ClickHouse for latest predictions (every 30 seconds). Uses standard or enriched predictions based on use_standard_predictions flag."""
+        """Poll ClickHouse for latest predictions. Uses standard or enriched predictions based on use_standard_predictions flag.
+
+        Polls once at startup, then ~10s after every 5-minute boundary (when new predictions land).
+        Only the signal timeframe (2h) drives retries: while it has not advanced since the boundary,
+        the poll is retried at +30s and +60s before going idle again. Other timeframes are not
+        published at every boundary, so waiting on them would only add idle queries.
+        """
+        retry_step = 0
+        # Whether this boundary's poll cycle is still waiting for a new signal-timeframe row
+        signal_pending = True
         while True:
             try:
                 # Skip if prediction provider not available (e.g., test mode or initialization failure)
@@ -227,34 +596,25 @@ class IPCUIServer:
                     await asyncio.sleep(30)
                     continue
 
-                # Query last 2 hours for all timeframes
+                # Query last 2 hours for all timeframes (provider takes datetimes as-is)
                 end_time_dt = datetime.now(UTC)
                 start_time_dt = end_time_dt - timedelta(hours=2)
-                start_time_str = start_time_dt.isoformat().replace("+00:00", "Z")
-                end_time_str = end_time_dt.isoformat().replace("+00:00", "Z")
 
-                for timeframe in [1, 2, 4]:
+                # Fetch all timeframes in one query (one ClickHouse round trip, awaited on the loop)
+                keys = [("V2", "BTC", str(timeframe)) for timeframe in PREDICTION_TIMEFRAMES]
+                if self.use_standard_predictions:
+                    predictions_by_key = await self.prediction_provider.get_standard_predictions_multi_async(
+                        start_time_dt, end_time_dt, keys
+                    )
+                else:
+                    # Fetch enriched predictions using prediction provider
+                    predictions_by_key = await self.prediction_provider.get_enriched_predictions_multi_async(
+                        start_time_dt, end_time_dt, keys
+                    )
+
+                for timeframe, key in zip(PREDICTION_TIMEFRAMES, keys):
                     try:
-                        # Fetch predictions based on mode using prediction provider
-                        if self.use_standard_predictions:
-                            predictions = await asyncio.to_thread(
-                                self.prediction_provider.get_standard_predictions,
-                                start_time_str,
-                                end_time_str,
-                                "V2",
-                                "BTC",
-                                str(timeframe),
-                            )
-                        else:
-                            # Fetch enriched predictions using prediction provider
-                            predictions = await asyncio.to_thread(
-                                self.prediction_provider.get_enriched_predictions,
-                                start_time_str,
-                                end_time_str,
-                                "V2",
-                                "BTC",
-                                str(timeframe),
-                            )
+                        predictions = predictions_by_key.get(key)
 
                         if predictions:
                             latest = predictions[-1]
@@ -274,62 +634,32 @@ class IPCUIServer:
                                     "prediction_timeframe": str(timeframe),  # String, not int
                                 }
 
-                                # Prepare broadcast data based on mode
-                                if self.use_standard_predictions:
-                                    # Standard predictions: no enrichment data
-                                    broadcast_data = {
-                                        "type": "prediction",
-                                        "data": {
-                                            "latest_prediction": formatted_prediction,
-                                            "newly_enriched": [],  # No enrichment data available
-                                        },
-                                    }
-                                else:
-                                    # Enriched predictions: include enrichment data
-                                    enriched_record = {
-                                        **formatted_prediction,
-                                        # Add enrichment fields (will be None if not enriched yet)
-                                        "binance_trade_price_prediction": latest.get(
-                                            "binance_trade_price_prediction"
-                                        ),
-                                        "binance_trade_price_predicted": latest.get(
-                                            "binance_trade_price_predicted"
-                                        ),
-                                        "binance_trade_time_prediction": latest.get(
-                                            "binance_trade_time_prediction"
-                                        ),
-                                        "binance_trade_time_predicted": latest.get(
-                                            "binance_trade_time_predicted"
-                                        ),
-                                        "diff_at_prediction_time": latest.get("diff_at_prediction_time"),
-                                        "diff_at_predicted_time": latest.get("diff_at_predicted_time"),
-                                    }
-
-                                    broadcast_data = {
-                                        "type": "prediction",
-                                        "data": {
-                                            "latest_prediction": formatted_prediction,
-                                            "newly_enriched": [enriched_record]
-                                            if latest.get("binance_trade_price_predicted")
-                                            else [],
-                                        },
-                                    }
+                                # Enriched mode only: attach the enrichment record once the row has
+                                # been enriched (standard predictions carry no enrichment data)
+                                newly_enriched = []
+                                if not self.use_standard_predictions and latest.get("binance_trade_price_predicted"):
+                                    newly_enriched.append(
+                                        formatted_prediction | {field: latest.get(field) for field in ENRICHMENT_FIELDS}
+                                    )
+
+                                broadcast_data = {
+                                    "type": "prediction",
+                                    "data": {
+                                        "latest_prediction": formatted_prediction,
+                                        "newly_enriched": newly_enriched,
+                                    },
+                                }
 
                                 # Broadcast to UI
                                 await self.broadcast(broadcast_data)
 
-                                self.log(
-                                    "INFO", f"New {timeframe}h prediction: ${latest['predicted_price']:.2f}"
-                                )
+                                self.log("INFO", "New %sh prediction: $%.2f", timeframe, latest["predicted_price"])
 
                                 # For 2h predictions: trigger signal check immediately (IPC strategy only)
-                                if (
-                                    timeframe == 2
-                                    and self.latest_tick
-                                    and self.strategy
-                                    and isinstance(self.strategy, IPCStrategy)
-                                ):
-                                    await self.strategy.check_signal_trigger(latest, self.latest_tick)
+                                if timeframe == SIGNAL_TIMEFRAME:
+                                    signal_pending = False
+                                    if self.latest_tick and self._signal_trigger is not None:
+                                        await self._signal_trigger(latest, self.latest_tick)
 
                     except Exception as e:
                         self.log("ERROR", f"Error fetching {timeframe}h prediction: {e}")
@@ -339,8 +669,40 @@ class IPCUIServer:
             except Exception as e:
                 self.log("ERROR", f"Error in prediction polling: {e}")
 
-            # Poll every 30 seconds
-            await asyncio.sleep(30)
+            # Next boundary once the 2h row has advanced (or retries are exhausted), else the
+            # next retry; a late 2h row still reaches _signal_trigger within the same boundary
+            if not signal_pending or retry_step >= len(PREDICTION_RETRY_DELAYS_SECONDS):
+                retry_step = 0
+                signal_pending = True
+                delay = _seconds_until_next_boundary(CLICKHOUSE_POLL_OFFSET_SECONDS)
+            else:
+                delay = PREDICTION_RETRY_DELAYS_SECONDS[retry_step]
+                if retry_step:
+                    delay -= PREDICTION_RETRY_DELAYS_SECONDS[retry_step - 1]
+                retry_step += 1
+            await asyncio.sleep(delay)
+
+    async def _fetch_oracle_predictions(self, timeframe: int, base_params: dict[str, str]) -> list[dict[str, Any]]:
+        """
+        Fetch one timeframe's prediction history from the Oracle API.
+
+        Args:
+            timeframe: Prediction timeframe in hours
+            base_params: Query params shared by all timeframes of a poll (token, model, time window)
+
+        Returns:
+            Predictions oldest first ([] on a non-200 or unsuccessful response)
+        """
+        oracle_api_url = "https://eagleoracle-production.up.railway.app/api/prediction-history"
+        params = {**base_params, "timeframe": str(timeframe)}
+
+        async with self.http_session.get(oracle_api_url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            if resp.status != 200:
+                return []
+            data = _json_loads(await resp.read())
+            if data.get("success") and data.get("predictions"):
+                return data["predictions"]
+            return []
 
     async def poll_oracle_api_predictions(self):
         """Poll Oracle API for latest predictions at ~:45 seconds past every 5 minutes (giving predictions time to generate)."""
@@ -352,105 +714,88 @@ class IPCUIServer:
                 # Calculate time until next 5-minute mark + 45 seconds
                 # Predictions are generated at :00, :05, :10, etc. but 1h predictions can take up to 30+ seconds
                 now = datetime.now(UTC)
-                current_minute = now.minute
-                current_second = now.second
-
-                # Find next 5-minute boundary (0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55)
-                minutes_past_boundary = current_minute % 5
-                if minutes_past_boundary == 0 and current_second >= 45:
-                    # Already past the :45 mark this cycle, wait for next one
-                    seconds_until_next = (5 * 60) - current_second + 45
-                elif minutes_past_boundary == 0:
-                    # At a 5-minute boundary but before :45
-                    seconds_until_next = 45 - current_second
-                else:
-                    # Between boundaries, wait until next boundary + 45 seconds
-                    minutes_until_boundary = 5 - minutes_past_boundary
-                    seconds_until_next = (minutes_until_boundary * 60) - current_second + 45
+                seconds_until_next = round(_seconds_until_next_boundary(ORACLE_POLL_OFFSET_SECONDS))
 
                 # Wait until the right moment
                 if seconds_until_next > 0:
-                    next_poll_time = now + timedelta(seconds=seconds_until_next)
-                    self.log("DEBUG", f"Next Oracle API poll at {next_poll_time.strftime('%H:%M:%S')} (in {seconds_until_next}s)")
+                    if self._log_enabled("DEBUG"):
+                        next_poll_time = now + timedelta(seconds=seconds_until_next)
+                        self.log("DEBUG", f"Next Oracle API poll at {next_poll_time.strftime('%H:%M:%S')} (in {seconds_until_next}s)")
                     await asyncio.sleep(seconds_until_next)
 
                 # Now fetch predictions
-                self.log("INFO", f"[Oracle API] Polling now at {datetime.now(UTC).strftime('%H:%M:%S')}...")
                 end_time_dt = datetime.now(UTC)
+                if self._log_enabled("INFO"):
+                    self.log("INFO", f"[Oracle API] Polling now at {end_time_dt.strftime('%H:%M:%S')}...")
                 start_time_dt = end_time_dt - timedelta(hours=2)
 
+                # Time window formatted once and shared by every timeframe's request
+                base_params = {
+                    "token": "BTC",
+                    "model": "v2",
+                    "startTime": start_time_dt.isoformat(),
+                    "endTime": end_time_dt.isoformat(),
+                }
+
+                # Fetch all timeframes concurrently over the shared session (~1 RTT instead of 3),
+                # then process results serially so broadcasts keep their timeframe order
+                results = await asyncio.gather(
+                    *(self._fetch_oracle_predictions(timeframe, base_params) for timeframe in PREDICTION_TIMEFRAMES),
+                    return_exceptions=True,
+                )
+
                 new_predictions_found = False
-                for timeframe in [1, 2, 4]:
+                for timeframe, predictions in zip(PREDICTION_TIMEFRAMES, results):
                     try:
-                        oracle_api_url = "https://eagleoracle-production.up.railway.app/api/prediction-history"
-                        params = {
-                            "token": "BTC",
-                            "model": "v2",
-                            "timeframe": str(timeframe),
-                            "startTime": start_time_dt.isoformat(),
-                            "endTime": end_time_dt.isoformat(),
-                        }
-
-                        connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
-                        async with aiohttp.ClientSession(connector=connector) as session:
-                            async with session.get(oracle_api_url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                                if resp.status == 200:
-                                    data = await resp.json()
-                                    if data.get("success") and data.get("predictions"):
-                                        predictions = data["predictions"]
-                                        if predictions:
-                                            # Get the latest prediction
-                                            latest = predictions[-1]
-                                            predicted_time = datetime.fromtimestamp(latest["predictionTime"], UTC).isoformat() if latest.get("predictionTime") else None
-
-                                            # Only broadcast if new (based on predicted_time)
-                                            if predicted_time != self.last_predicted_times[timeframe]:
-                                                self.last_predicted_times[timeframe] = predicted_time
-
-                                                # Format prediction for UI
-                                                formatted_prediction = {
-                                                    "id": str(latest.get("predictionMadeTime", "")),
-                                                    "prediction_time": datetime.fromtimestamp(latest["predictionMadeTime"], UTC).isoformat() if latest.get("predictionMadeTime") else None,
-                                                    "prediction_price": float(latest.get("priceAtPrediction", 0)),
-                                                    "predicted_time": predicted_time,
-                                                    "predicted_price": float(latest.get("predictedPrice", 0)),
-                                                    "prediction_timeframe": str(timeframe),
-                                                }
-
-                                                broadcast_data = {
-                                                    "type": "prediction",
-                                                    "data": {
-                                                        "latest_prediction": formatted_prediction,
-                                                        "newly_enriched": [],
-                                                    },
-                                                }
-
-                                                # Broadcast to UI
-                                                await self.broadcast(broadcast_data)
-                                                new_predictions_found = True
-
-                                                self.log(
-                                                    "INFO", f"[Oracle API] New {timeframe}h prediction: ${latest['predictedPrice']:.2f}"
-                                                )
-
-                                                # For 2h predictions: trigger signal check
-                                                if (
-                                                    timeframe == 2
-                                                    and self.latest_tick
-                                                    and self.strategy
-                                                    and isinstance(self.strategy, IPCStrategy)
-                                                ):
-                                                    await self.strategy.check_signal_trigger(formatted_prediction, self.latest_tick)
+                        if isinstance(predictions, BaseException):
+                            raise predictions
+                        if predictions:
+                            # Get the latest prediction
+                            latest = predictions[-1]
+                            predicted_time = _epoch_to_iso(latest["predictionTime"]) if latest.get("predictionTime") else None
+
+                            # Only broadcast if new (based on predicted_time)
+                            if predicted_time != self.last_predicted_times[timeframe]:
+                                self.last_predicted_times[timeframe] = predicted_time
+
+                                # Format prediction for UI
+                                formatted_prediction = {
+                                    "id": str(latest.get("predictionMadeTime", "")),
+                                    "prediction_time": _epoch_to_iso(latest["predictionMadeTime"]) if latest.get("predictionMadeTime") else None,
+                                    "prediction_price": float(latest.get("priceAtPrediction", 0)),
+                                    "predicted_time": predicted_time,
+                                    "predicted_price": float(latest.get("predictedPrice", 0)),
+                                    "prediction_timeframe": str(timeframe),
+                                }
+
+                                broadcast_data = {
+                                    "type": "prediction",
+                                    "data": {
+                                        "latest_prediction": formatted_prediction,
+                                        "newly_enriched": [],
+                                    },
+                                }
+
+                                # Broadcast to UI
+                                await self.broadcast(broadcast_data)
+                                new_predictions_found = True
+
+                                self.log(
+                                    "INFO", "[Oracle API] New %sh prediction: $%.2f", timeframe, latest["predictedPrice"]
+                                )
+
+                                # For 2h predictions: trigger signal check
+                                if timeframe == 2 and self.latest_tick and self._signal_trigger is not None:
+                                    await self._signal_trigger(formatted_prediction, self.latest_tick)
 
                     except Exception as e:
                         self.log("ERROR", f"Error fetching {timeframe}h prediction from Oracle API: {e}")
 
                 if not new_predictions_found:
-                    self.log("DEBUG", f"[Oracle API] No new predictions detected (same timestamps as before)")
+                    self.log("DEBUG", "[Oracle API] No new predictions detected (same timestamps as before)")
 
             except Exception as e:
                 self.log("ERROR", f"Error in Oracle API prediction polling: {e}")
-                import traceback
                 self.log("ERROR", f"Traceback: {traceback.format_exc()}")
                 # On error, wait 30 seconds before retrying
                 await asyncio.sleep(30)
@@ -484,34 +829,32 @@ class IPCUIServer:
                 "endTime": end_time_str,
             }
 
-            connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(oracle_api_url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        # Transform to Tracer Tool format
-                        if data.get("success") and data.get("predictions"):
-                            predictions = []
-                            for p in data["predictions"]:
-                                predictions.append({
-                                    "id": str(p.get("predictionMadeTime", "")),
-                                    "prediction_time": datetime.fromtimestamp(p["predictionMadeTime"], UTC).isoformat() if p.get("predictionMadeTime") else None,
-                                    "prediction_price": p.get("priceAtPrediction", 0),
-                                    "predicted_time": datetime.fromtimestamp(p["predictionTime"], UTC).isoformat() if p.get("predictionTime") else None,
-                                    "predicted_price": p.get("predictedPrice", 0),
-                                    "version": version,
-                                    "symbol": symbol,
-                                    "hours": timeframe,
-                                })
-                            return web.json_response(predictions)
-                        return web.json_response([])
-                    else:
-                        self.log("ERROR", f"Oracle API error: {resp.status}")
-                        return web.json_response({"error": f"Oracle API error: {resp.status}"}, status=resp.status)
+            async with self.http_session.get(oracle_api_url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    data = _json_loads(await resp.read())
+                    # Transform to Tracer Tool format
+                    if data.get("success") and data.get("predictions"):
+                        predictions = []
+                        for p in data["predictions"]:
+                            predictions.append({
+                                "id": str(p.get("predictionMadeTime", "")),
+                                "prediction_time": _epoch_to_iso(p["predictionMadeTime"]) if p.get("predictionMadeTime") else None,
+                                "prediction_price": p.get("priceAtPrediction", 0),
+                                "predicted_time": _epoch_to_iso(p["predictionTime"]) if p.get("predictionTime") else None,
+                                "predicted_price": p.get("predictedPrice", 0),
+                                "version": version,
+                                "symbol": symbol,
+                                "hours": timeframe,
+                            })
+                        return _json_response(predictions)
+                    return _json_response([])
+                else:
+                    self.log("ERROR", f"Oracle API error: {resp.status}")
+                    return _json_response({"error": f"Oracle API error: {resp.status}"}, status=resp.status)
 
         except Exception as e:
             self.log("ERROR", f"Error getting predictions: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
     async def handle_backtest_trades(self, request: web.Request) -> web.Response:
         """
@@ -583,81 +926,71 @@ class IPCUIServer:
             # Call Oracle's IPC Strategy Playbook - returns EXACT trades from BacktestHub
             oracle_api_url = "https://eagleoracle-production.up.railway.app/api/backtest/ipc-strategy-playbook"
 
-            connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
-            async with aiohttp.ClientSession(connector=connector) as http_session:
-                async with http_session.post(
-                    oracle_api_url,
-                    json=playbook_body,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        self.log("ERROR", f"Oracle Playbook API error: {resp.status} - {error_text[:200]}")
-                        return web.json_response({"error": f"Oracle API error: {resp.status}"}, status=resp.status)
-                    data = await resp.json()
+            async with self.http_session.post(
+                oracle_api_url,
+                data=_json_dumps(playbook_body),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as resp:
+                if resp.status != 200:
+                    error_text = await resp.text()
+                    self.log("ERROR", f"Oracle Playbook API error: {resp.status} - {error_text[:200]}")
+                    return _json_response({"error": f"Oracle API error: {resp.status}"}, status=resp.status)
+                data = _json_loads(await resp.read())
 
             if not data.get("success") or not data.get("data"):
                 self.log("WARNING", f"Oracle Playbook returned no data: {data}")
-                return web.json_response({"trades": [], "stats": {}})
+                return _json_response({"trades": [], "stats": {}})
 
             playbook_data = data["data"]
             oracle_trades = playbook_data.get("trades", [])
             oracle_stats = playbook_data.get("stats", {})
 
-            # Convert Oracle trades to Tracer format
-            trades = []
-            nyc_tz = ZoneInfo("America/New_York")
+            # Convert Oracle trades to Tracer format (PnL percentages computed in one vectorized pass)
+            trades: list[_BacktestTrade] = []
+            pnl_percents, total_pnl_percent = _playbook_pnl_percents(oracle_trades)
 
+            # Create NYC datetimes and convert to UTC timestamps (0 when unparseable);
+            # exit time is entry + horizon hours, ISO-formatted for all trades in one batch
+            horizon_seconds = int(timeframe) * 3600
+            entry_times = []
             for t in oracle_trades:
-                # Parse date and time to create timestamps
                 date_str = t.get("date", "")
+                if not date_str:
+                    # Partial upstream rows: skip the (slow) strptime failure path entirely
+                    entry_times.append((0, None))
+                    continue
                 time_nyc = t.get("timeNYC", "00:00")
-
-                # Create NYC datetime and convert to UTC timestamp
                 try:
-                    nyc_dt = datetime.strptime(f"{date_str} {time_nyc}", "%Y-%m-%d %H:%M")
-                    nyc_dt = nyc_dt.replace(tzinfo=nyc_tz)
-                    entry_timestamp = int(nyc_dt.timestamp())
-                    # Exit time is entry + horizon hours
-                    exit_timestamp = entry_timestamp + (int(timeframe) * 3600)
-                except:
-                    entry_timestamp = 0
-                    exit_timestamp = 0
-
-                # Calculate PnL percentage from entry/exit prices
-                entry_price = t.get("entry", 0)
-                exit_price = t.get("exit", 0)
-                direction = t.get("direction", "LONG")
-                if entry_price and entry_price != 0:
-                    if direction == "LONG":
-                        pnl_percent = ((exit_price - entry_price) / entry_price) * 100
-                    else:  # SHORT
-                        pnl_percent = ((entry_price - exit_price) / entry_price) * 100
-                else:
-                    pnl_percent = 0
-
-                trade = {
-                    "id": t.get("id", len(trades) + 1),
-                    "direction": direction,
-                    "entryTime": entry_timestamp,
-                    "entryTimeISO": nyc_dt.astimezone(UTC).isoformat() if entry_timestamp else None,
-                    "exitTime": exit_timestamp,
-                    "exitTimeISO": datetime.fromtimestamp(exit_timestamp, UTC).isoformat() if exit_timestamp else None,
-                    "entryPrice": entry_price,
-                    "exitPrice": exit_price,
-                    "predictedPrice": t.get("target", 0),
-                    "delta": t.get("dollarMove", 0),
-                    "pnl": t.get("profitPerContract", 0),  # Dollar PnL per contract
-                    "pnlPercent": round(pnl_percent, 2),   # Percentage PnL
-                    "pnlTotal": t.get("profitTotal", 0),   # Total PnL with contracts
-                    "result": t.get("result", "LOSS"),
-                    "indicators": t.get("indicators", {}),
-                    "timeNYC": time_nyc,
-                }
-                trades.append(trade)
-
-            # Calculate total percentage P&L (sum of all trade percentages)
-            total_pnl_percent = sum(t.get("pnlPercent", 0) for t in trades)
+                    entry_times.append(_nyc_entry_time(date_str, time_nyc))
+                except (ValueError, TypeError) as e:
+                    self.log("DEBUG", "Unparseable playbook trade time %r %r: %s", date_str, time_nyc, e)
+                    entry_times.append((0, None))
+            exit_timestamps = [entry_ts + horizon_seconds if entry_ts else 0 for entry_ts, _ in entry_times]
+            exit_isos = _epochs_to_iso(exit_timestamps)
+
+            for t, pnl_percent, (entry_timestamp, entry_iso), exit_timestamp, exit_iso in zip(
+                oracle_trades, pnl_percents, entry_times, exit_timestamps, exit_isos
+            ):
+                get = t.get
+                trades.append(_BacktestTrade(
+                    id=get("id", len(trades) + 1),
+                    direction=get("direction", "LONG"),
+                    entryTime=entry_timestamp,
+                    entryTimeISO=entry_iso if entry_timestamp else None,
+                    exitTime=exit_timestamp,
+                    exitTimeISO=exit_iso,
+                    entryPrice=get("entry", 0),
+                    exitPrice=get("exit", 0),
+                    predictedPrice=get("target", 0),
+                    delta=get("dollarMove", 0),
+                    pnl=get("profitPerContract", 0),
+                    pnlPercent=pnl_percent,
+                    pnlTotal=get("profitTotal", 0),
+                    result=get("result", "LOSS"),
+                    indicators=get("indicators", {}),
+                    timeNYC=get("timeNYC", "00:00"),
+                ))
 
             # Use Oracle's stats directly
             stats = {
@@ -673,7 +1006,7 @@ class IPCUIServer:
 
             self.log("INFO", f"Playbook returned: {stats['totalTrades']} trades, {stats['winRate']}% win rate, ${stats['totalPnL']} total PnL")
 
-            return web.json_response({
+            return _json_response({
                 "trades": trades,
                 "stats": stats,
                 "strategy": playbook_data.get("strategy", {}),
@@ -682,32 +1015,84 @@ class IPCUIServer:
 
         except Exception as e:
             self.log("ERROR", f"Error in backtest trades: {e}")
-            import traceback
             traceback.print_exc()
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
     # ============================================
     # 4. WEBSOCKET BROADCAST
     # ============================================
 
-    async def broadcast(self, message: dict[str, Any]):
-        """Broadcast message to all connected UI clients."""
+    async def _client_writer(
+        self, ws: web.WebSocketResponse, queue: asyncio.Queue[bytes], client_ip: str
+    ) -> None:
+        """Drain one UI client's outgoing queue; disconnects it if a send fails or stalls."""
+        try:
+            while True:
+                payload = await queue.get()
+                # Payloads are already UTF-8: frame them as text directly (send_str would re-encode)
+                await asyncio.wait_for(ws.send_frame(payload, WSMsgType.TEXT), timeout=WS_SEND_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            self.log(
+                "WARNING", "Disconnecting slow WebSocket client %s: send stalled for %ss",
+                client_ip, WS_SEND_TIMEOUT_SECONDS,
+            )
+            self._disconnect_client(ws)
+        except ConnectionResetError:
+            self.log("DEBUG", "WebSocket client %s went away mid-send", client_ip)
+            self._disconnect_client(ws)
+        except Exception as e:
+            self.log(
+                "WARNING", "Disconnecting WebSocket client %s after send failure: %s: %r",
+                client_ip, type(e).__name__, e,
+            )
+            self._disconnect_client(ws)
+
+    def _disconnect_client(self, ws: web.WebSocketResponse) -> None:
+        """Stop broadcasting to a client and close its socket in the background."""
+        if self.ws_clients.pop(ws, None) is None:
+            return
+        task = asyncio.create_task(ws.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    async def broadcast(self, message: dict[str, Any] | bytes | str):
+        """
+        Broadcast message to all connected UI clients.
+
+        Args:
+            message: Message dict, or an already-encoded JSON payload from producers
+                that serialize up front (e.g. IPCStrategy with msgspec)
+        """
         if not self.ws_clients:
             return
 
         try:
-            message_str = json.dumps(message)
-
-            # Send to all clients
-            disconnected = set()
-            for ws in self.ws_clients:
+            # Encode to UTF-8 bytes once; every client's writer sends the same payload
+            if isinstance(message, dict):
+                payload = _json_dumps(message)
+            elif isinstance(message, str):
+                payload = message.encode()
+            else:
+                payload = message
+
+            # Hand to each client's writer task (encoded once above); never waits on a socket.
+            # A full queue means the client can't keep up: ticks are simply skipped for it
+            # (the next one supersedes them), anything else disconnects it so it reconnects
+            # and resyncs instead of silently missing events.
+            droppable = isinstance(message, dict) and message.get("type") == "trade"
+            lagging = None
+            for ws, queue in self.ws_clients.items():
                 try:
-                    await ws.send_str(message_str)
-                except Exception:
-                    disconnected.add(ws)
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    if not droppable:
+                        lagging = lagging or []
+                        lagging.append(ws)
 
-            # Clean up disconnected clients
-            self.ws_clients -= disconnected
+            # Disconnect after the loop (no per-broadcast snapshot copy of ws_clients needed)
+            if lagging:
+                for ws in lagging:
+                    self._disconnect_client(ws)
 
         except Exception as e:
             self.log("ERROR", f"Error broadcasting: {e}")
@@ -717,39 +1102,52 @@ class IPCUIServer:
         """Poll v2.3 shadow predictions from validator API every 30 seconds and broadcast to UI."""
         VALIDATOR_URL = "http://127.0.0.1:8790/api/v23/feed?limit=5&days=1"
         last_timestamp = None
+        # Conditional request headers from the last 200 response (validator ETag/Last-Modified);
+        # an unchanged feed then comes back as an empty 304 instead of a full JSON body
+        conditional_headers: dict[str, str] = {}
 
         self.log("INFO", "v2.3 prediction polling started (every 30s)")
         while True:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(VALIDATOR_URL, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            predictions = data.get("predictions", [])
-                            if predictions:
-                                latest = predictions[-1]
-                                ts = latest.get("prediction_made_time")
-                                if ts != last_timestamp:
-                                    last_timestamp = ts
-                                    preds = latest.get("predictions", {})
-                                    broadcast_data = {
-                                        "type": "prediction_v23",
-                                        "data": {
-                                            "timestamp": ts,
-                                            "current_price": latest.get("current_price"),
-                                            "direction": latest.get("direction"),
-                                            "confidence": latest.get("confidence"),
-                                            "direction_1h": preds.get("1h", {}).get("direction_prob"),
-                                            "direction_2h": preds.get("2h", {}).get("direction_prob"),
-                                            "direction_4h": preds.get("4h", {}).get("direction_prob"),
-                                            "magnitude_1h": preds.get("1h", {}).get("magnitude_pct"),
-                                            "magnitude_2h": preds.get("2h", {}).get("magnitude_pct"),
-                                            "magnitude_4h": preds.get("4h", {}).get("magnitude_pct"),
-                                            "is_backfill": latest.get("is_backfill", False),
-                                        }
+                async with self.http_session.get(
+                    VALIDATOR_URL, headers=conditional_headers, timeout=aiohttp.ClientTimeout(total=10)
+                ) as resp:
+                    if resp.status == 200:
+                        conditional_headers = {}
+                        if etag := resp.headers.get("ETag"):
+                            conditional_headers["If-None-Match"] = etag
+                        if last_modified := resp.headers.get("Last-Modified"):
+                            conditional_headers["If-Modified-Since"] = last_modified
+
+                        data = _json_loads(await resp.read())
+                        predictions = data.get("predictions", [])
+                        if predictions:
+                            latest = predictions[-1]
+                            ts = latest.get("prediction_made_time")
+                            if ts != last_timestamp:
+                                last_timestamp = ts
+                                preds = latest.get("predictions", {})
+                                broadcast_data = {
+                                    "type": "prediction_v23",
+                                    "data": {
+                                        "timestamp": ts,
+                                        "current_price": latest.get("current_price"),
+                                        "direction": latest.get("direction"),
+                                        "confidence": latest.get("confidence"),
+                                        "direction_1h": preds.get("1h", {}).get("direction_prob"),
+                                        "direction_2h": preds.get("2h", {}).get("direction_prob"),
+                                        "direction_4h": preds.get("4h", {}).get("direction_prob"),
+                                        "magnitude_1h": preds.get("1h", {}).get("magnitude_pct"),
+                                        "magnitude_2h": preds.get("2h", {}).get("magnitude_pct"),
+                                        "magnitude_4h": preds.get("4h", {}).get("magnitude_pct"),
+                                        "is_backfill": latest.get("is_backfill", False),
                                     }
-                                    await self.broadcast(broadcast_data)
-                                    self.log("INFO", f"v2.3 prediction broadcast: {latest.get('direction')} conf={latest.get('confidence'):.0%}")
+                                }
+                                await self.broadcast(broadcast_data)
+                                self.log(
+                                    "INFO", "v2.3 prediction broadcast: %s conf=%.0f%%",
+                                    latest.get("direction"), latest.get("confidence") * 100,
+                                )
             except Exception as e:
                 self.log("WARNING", f"v2.3 poll error: {e}")
             await asyncio.sleep(30)
@@ -758,38 +1156,41 @@ class IPCUIServer:
         """Broadcast strategy heartbeats every 5 seconds matching UI_Server format."""
         while True:
             try:
-                if self.strategy:
+                if self._get_strategy_state is not None:
                     # Check if strategy wants to suppress heartbeats (for offline simulation)
                     should_suppress = False
-                    if hasattr(self.strategy, "should_suppress_heartbeat"):
+                    if self._suppress_heartbeat is not None:
                         try:
-                            should_suppress = self.strategy.should_suppress_heartbeat()
+                            should_suppress = self._suppress_heartbeat()
                         except Exception as e:
                             self.log("WARNING", f"Error checking heartbeat suppression: {e}")
 
-                    if should_suppress:
-                        # Skip sending heartbeat during offline simulation
+                    if should_suppress or not self.ws_clients:
+                        # Skip sending heartbeat during offline simulation, or with nobody to send to
                         await asyncio.sleep(5)
                         continue
 
-                    # Get strategy state
-                    strategy_state = {}
+                    # Get strategy state; both strategies return a read-only dict that is replaced
+                    # on every change, so the same object means the encoded state can be reused
                     try:
-                        strategy_state = self.strategy.get_strategy_state()
+                        strategy_state = self._get_strategy_state()
                     except Exception as e:
                         self.log("WARNING", f"Failed to get strategy state: {e}")
-
-                    # Build heartbeat message matching UI_Server.py lines 888-896
-                    instance_name = "TestStrategy" if self.test_mode else "IPC"
-                    heartbeat_message = {
-                        "type": "strategy_heartbeat",
-                        "data": {
-                            "instance_name": instance_name,
-                            "instance_id": self.runtime_id,
-                            "heartbeat_at": datetime.now(UTC).isoformat(),
-                            "strategy_state": strategy_state,
-                        },
-                    }
+                        strategy_state = {}
+                    if strategy_state is not self._heartbeat_state:
+                        self._heartbeat_state_json = _json_dumps(strategy_state)
+                        self._heartbeat_state = strategy_state
+
+                    # Heartbeat message matching UI_Server.py lines 888-896: the constant prefix is
+                    # encoded once in start(); heartbeat_at changes every beat and is always sent,
+                    # since the UI marks a strategy stale after ~7s without one
+                    heartbeat_message = b"".join((
+                        self._heartbeat_prefix,
+                        _json_dumps(_iso_now()),
+                        b',"strategy_state":',
+                        self._heartbeat_state_json,
+                        b"}}",
+                    ))
 
                     await self.broadcast(heartbeat_message)
 
@@ -804,14 +1205,17 @@ class IPCUIServer:
         ws = web.WebSocketResponse()
         await ws.prepare(request)
 
-        self.ws_clients.add(ws)
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=WS_CLIENT_QUEUE_SIZE)
+        self.ws_clients[ws] = queue
         client_ip = request.remote or "unknown"
+        writer = asyncio.create_task(self._client_writer(ws, queue, client_ip))
         self.log("INFO", f"WebSocket connected: {client_ip} (total: {len(self.ws_clients)})")
 
         try:
-            # Send current state on connect (IPC strategy only)
+            # Send current state on connect (IPC strategy only); queued so it stays ordered
+            # ahead of subsequent broadcasts
             if self.strategy and isinstance(self.strategy, IPCStrategy) and self.strategy.active_signal:
-                await ws.send_str(json.dumps({"type": "signal_state", "data": self.strategy.active_signal}))
+                queue.put_nowait(_json_dumps({"type": "signal_state", "data": self.strategy.signal_snapshot()}))
 
             async for msg in ws:
                 if msg.type == web.WSMsgType.TEXT:
@@ -820,7 +1224,8 @@ class IPCUIServer:
                 elif msg.type == web.WSMsgType.ERROR:
                     self.log("ERROR", f"WebSocket error: {ws.exception()}")
         finally:
-            self.ws_clients.discard(ws)
+            writer.cancel()
+            self.ws_clients.pop(ws, None)
             self.log("INFO", f"WebSocket disconnected: {client_ip} (remaining: {len(self.ws_clients)})")
 
         return ws
@@ -831,21 +1236,23 @@ class IPCUIServer:
 
     async def handle_mode(self, request: web.Request) -> web.Response:
         """Return server mode information."""
-        return web.json_response(
-            {
-                "mode": "live",
-                "simulation": False,
-                "features": {"ws_channels": ["ticks:compressed:binance:btcusdt"]},
-                "version": "IPC_UI_Server",
-                "timestamp": datetime.now(UTC).isoformat(),
-            }
-        )
+        second = int(time.time())
+        if second != self._mode_body_second:
+            self._mode_body = _json_dumps(
+                {
+                    "mode": "live",
+                    "simulation": False,
+                    "features": {"ws_channels": ["ticks:compressed:binance:btcusdt"]},
+                    "version": "IPC_UI_Server",
+                    "timestamp": _iso_now(),
+                }
+            )
+            self._mode_body_second = second
+        return web.Response(body=self._mode_body, content_type="application/json")
 
     async def handle_strategy_instances(self, request: web.Request) -> web.Response:
         """Return IPC strategy instance for UI compatibility."""
-        if self.test_mode:
-            return web.json_response(["TestStrategy"])
-        return web.json_response(["IPC"])
+        return web.Response(body=self._instances_body, content_type="application/json")
 
     async def handle_strategy_events(self, request: web.Request) -> web.Response:
         """
@@ -860,11 +1267,16 @@ class IPCUIServer:
             asyncio.create_task(self.strategy.start())
 
         # Return empty list (no historic events for IPC_UI_Server)
-        return web.json_response([])
+        return _json_response([])
 
-    async def handle_index(self, request: web.Request) -> web.FileResponse:
-        """Serve main UI page."""
-        return web.FileResponse("./ui/chart.html")
+    async def handle_index(self, request: web.Request) -> web.StreamResponse:
+        """Serve main UI page from memory (304 when the browser's cached copy is current)."""
+        if not self._index_body:
+            return web.FileResponse(UI_INDEX_PATH)
+        headers = {"ETag": self._index_etag, "Cache-Control": f"max-age={UI_INDEX_MAX_AGE_SECONDS}"}
+        if request.headers.get("If-None-Match") == self._index_etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=self._index_body, content_type="text/html", headers=headers)
 
     async def handle_telemetry_stub(self, request: web.Request) -> web.Response:
         """Stub handler for telemetry endpoints (traces, logs). Just accepts and ignores."""
@@ -899,7 +1311,7 @@ class IPCUIServer:
         self.app.router.add_post("/api/logs", self.handle_telemetry_stub)
 
         # Static files (UI)
-        self.app.router.add_static("/js/", "./ui/js/")
+        self.app.router.add_static("/js/", "./ui/js/", follow_symlinks=False, append_version=True)
         self.app.router.add_get("/", self.handle_index)
         self.app.router.add_get("/chart.html", self.handle_index)  # Also serve at /chart.html
 
@@ -915,6 +1327,11 @@ class IPCUIServer:
         pid = os.getpid()
         self.runtime_id = f"{hostname}-{pid}-{int(datetime.now(UTC).timestamp())}"
         self.log("INFO", f"Runtime ID: {self.runtime_id}")
+        heartbeat_ids = _json_dumps({
+            "instance_name": "TestStrategy" if self.test_mode else "IPC",
+            "instance_id": self.runtime_id,
+        })
+        self._heartbeat_prefix = b'{"type":"strategy_heartbeat","data":' + heartbeat_ids[:-1] + b',"heartbeat_at":'
 
         # Initialize strategy based on mode
         if self.test_mode:
@@ -933,6 +1350,8 @@ class IPCUIServer:
                 # offline_start_delay=10.0,
                 # offline_duration=10.0,
             )
+            # Test strategy tracks the current price from every tick
+            self._process_tick = self.strategy.on_tick_compact
             self.log("INFO", "✓ Simple Test Strategy initialized")
         else:
             self.log("INFO", "📊 LIVE MODE: Initializing IPC Strategy")
@@ -947,8 +1366,16 @@ class IPCUIServer:
                 max_position_duration_hours=2,
                 session_filter=True,
             )
+            # IPC strategy: ticks are queued for batched position management; new 2h
+            # predictions trigger signal checks
+            self._process_tick = self._queue_strategy_tick
+            self._signal_trigger = self.strategy.check_signal_trigger
             self.log("INFO", "✓ IPC Strategy initialized")
 
+        # Heartbeat hooks (only the test strategy can suppress heartbeats, to simulate going offline)
+        self._suppress_heartbeat = getattr(self.strategy, "should_suppress_heartbeat", None)
+        self._get_strategy_state = self.strategy.get_strategy_state
+
         # Initialize EAI Prediction Provider (manages its own ClickHouse connection)
         # Optional: If ClickHouse credentials are provided, predictions will be displayed
         # If not available, server continues without predictions
@@ -960,6 +1387,8 @@ class IPCUIServer:
                 clickhouse_user=self.clickhouse_user,
                 clickhouse_password=self.clickhouse_password,
                 clickhouse_database=self.clickhouse_database,
+                clickhouse_native_port=self.clickhouse_native_port,
+                clickhouse_query_cache=self.clickhouse_query_cache,
             )
             self.log("INFO", "✓ EAI Prediction Provider initialized with ClickHouse connection")
             if self.test_mode:
@@ -972,16 +1401,37 @@ class IPCUIServer:
             else:
                 self.log("WARNING", "Running without prediction support")
 
+        # Load the UI page once (served from memory with an ETag)
+        try:
+            self._index_body = UI_INDEX_PATH.read_bytes()
+            self._index_etag = f'"{hashlib.sha1(self._index_body).hexdigest()}"'
+        except OSError as e:
+            self.log("WARNING", f"UI page not preloaded ({e}); serving from disk per request")
+
         # Setup routes
         self.setup_routes()
 
+        # One pooled HTTP session for all outbound requests: connections, TLS sessions and
+        # DNS lookups are reused instead of set up per request
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=SSL_CONTEXT,
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+            )
+        )
+
         # Start background tasks
         self.log("INFO", "Starting Binance tick stream...")
         self.binance_ws_task = asyncio.create_task(self.start_binance_tick_stream())
+        if isinstance(self.strategy, IPCStrategy):
+            self.strategy_tick_task = asyncio.create_task(self._strategy_tick_loop())
 
         # Start prediction polling - use ClickHouse if available, otherwise fallback to Oracle API
         if self.prediction_provider:
-            self.log("INFO", "Starting prediction polling via ClickHouse (every 30s)...")
+            self.log("INFO", "Starting prediction polling via ClickHouse (every 5 min, +10s)...")
             self.prediction_poll_task = asyncio.create_task(self.poll_latest_predictions())
         else:
             self.log("INFO", "ClickHouse not available - using Oracle API fallback for predictions...")
@@ -1018,6 +1468,8 @@ class IPCUIServer:
         """Stop the server."""
         if self.binance_ws_task:
             self.binance_ws_task.cancel()
+        if self.strategy_tick_task:
+            self.strategy_tick_task.cancel()
         if self.prediction_poll_task:
             self.prediction_poll_task.cancel()
         if self.v23_poll_task:
@@ -1032,9 +1484,16 @@ class IPCUIServer:
                 await self.heartbeat_task
             except asyncio.CancelledError:
                 pass
-        # Close prediction provider (closes its own ClickHouse connection)
+        # Deliver strategy events still queued for the UI (clients are connected until shutdown)
+        if isinstance(self.strategy, IPCStrategy):
+            await self.strategy.aclose()
+        elif self.strategy is not None:
+            await self.strategy.stop()
+        # Close prediction provider (closes its own ClickHouse connections)
         if self.prediction_provider:
-            self.prediction_provider.close()
+            await self.prediction_provider.aclose()
+        if self.http_session:
+            await self.http_session.close()
 
 
 # ============================================
@@ -1070,7 +1529,10 @@ def main():
     )
 
     try:
-        asyncio.run(server.start())
+        if HAS_UVLOOP:
+            uvloop.run(server.start())
+        else:
+            asyncio.run(server.start())
     except KeyboardInterrupt:
         print("\nShutting down...")
 
@@ -28,10 +28,24 @@ Predictable behavior:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import functools
+import time
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
 from typing import Any
 
+from ipc_server._strategy_common import format_event_id, strategy_state_dict
+from ipc_server._tick_kernel import ACTION_NONE, ACTION_TRAIL_ACTIVATED, trailing_update
+
+# How long stop() waits for queued strategy events to reach the UI before giving up on them
+EMIT_DRAIN_TIMEOUT_SECONDS = 5.0
+
+
+@functools.lru_cache(maxsize=2)
+def _utc_second_iso(seconds: int) -> str:
+    """ISO8601 date/time prefix ("YYYY-MM-DDTHH:MM:SS") for an epoch second (cached for the current second)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
 
 class SimpleTestStrategy:
     """
@@ -89,6 +103,7 @@ class SimpleTestStrategy:
         # Instance tracking
         self.instance_name = instance_name
         self.event_counter = 0  # For generating unique event IDs
+        self._event_id_prefix = f"{instance_name}_"
 
         # Configurable parameters
         self.entry_delay_seconds = params.get("entry_delay_seconds", 5)  # After trigger
@@ -101,6 +116,7 @@ class SimpleTestStrategy:
             "trailing_stop_distance", 900
         )  # Points behind peak for trailing SL
         self.direction = params.get("direction", "LONG")  # LONG or SHORT
+        self._sign = 1 if self.direction == "LONG" else -1  # Price direction for the trailing kernel
         self.simulate_price_movement = params.get("simulate_price_movement", True)  # Simulate price ticks
         self.price_simulation_interval = params.get(
             "price_simulation_interval", 2.0
@@ -115,6 +131,9 @@ class SimpleTestStrategy:
         self.is_running = False
         self.start_time: datetime | None = None
         self.entry_time: datetime | None = None
+        # Offline simulation window as monotonic_ns deadlines, fixed at entry (None when flat or once passed)
+        self._offline_start_ns: int | None = None
+        self._offline_end_ns: int | None = None
         self.entry_price: float | None = None
         self.current_price: float | None = None  # Track current market price from ticks
         self.stop_loss_price: float | None = None
@@ -122,14 +141,22 @@ class SimpleTestStrategy:
         self.trailing_activation_price: float | None = None
         self.trailing_stop_active: bool = False
         self.peak_price: float | None = None
+        self._last_checked_price: float | None = None  # Last tick price run through _check_trailing_stop
 
         # Task management
         self.strategy_task: asyncio.Task | None = None
 
+        # Outgoing event queue, drained in order by _emit_loop (started on first event)
+        self._emit_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._emit_task: asyncio.Task[None] | None = None
+
         # Strategy state tracking
         self.strategy_state: dict[str, Any] = {}
         self._state_sequence: int = 0
         self._offline_frozen_state: dict[str, Any] | None = None  # State snapshot before going offline
+        # One-shot debug log flags for the offline window (cleared on reset)
+        self._logged_offline_start = False
+        self._logged_suppression = False
 
     def _default_log(self, level: str, message: str) -> None:
         """Default logging if no callback provided."""
@@ -138,42 +165,66 @@ class SimpleTestStrategy:
 
     def _is_in_offline_window(self) -> bool:
         """Check if we're currently in the offline simulation window."""
-        if not self.simulate_offline:
+        if not self.simulate_offline or self._offline_start_ns is None:
             return False
 
-        if not self.entry_time:
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._offline_end_ns:
+            # Window is over for this position: later calls return above without reading the clock
+            self._offline_start_ns = None
             return False
-
-        time_since_entry = (datetime.now(UTC) - self.entry_time).total_seconds()
-        offline_start = self.offline_start_delay
-        offline_end = self.offline_start_delay + self.offline_duration
-
-        is_offline = offline_start <= time_since_entry < offline_end
+        is_offline = now_ns >= self._offline_start_ns
 
         # Debug logging to help troubleshoot
-        if is_offline and not hasattr(self, "_logged_offline_start"):
+        if is_offline and not self._logged_offline_start:
             self._logged_offline_start = True
-            self.log("INFO", f"🔍 DEBUG: Entering offline window at {time_since_entry:.1f}s after entry")
+            self.log(
+                "INFO",
+                f"🔍 DEBUG: Entering offline window at "
+                f"{(now_ns - self._offline_start_ns) / 1e9 + self.offline_start_delay:.1f}s after entry",
+            )
 
         return is_offline
 
+    def _emit(self, event: dict[str, Any]) -> None:
+        """Queue a strategy event for _emit_loop so UI fan-out never stalls the strategy sequence."""
+        if self._emit_task is None:
+            self._emit_task = asyncio.create_task(self._emit_loop())
+        self._emit_queue.put_nowait(event)
+
+    async def _emit_loop(self) -> None:
+        """Deliver queued strategy events to the broadcast callback, in order."""
+        # Bound once: stop() may swap in a fresh queue while this loop is being cancelled
+        queue = self._emit_queue
+        while True:
+            event = await queue.get()
+            try:
+                await self.broadcast(event)
+            except Exception as e:
+                self.log("ERROR", f"Error broadcasting strategy event: {e}")
+            finally:
+                queue.task_done()
+
+    def _next_event_id(self) -> tuple[str, str]:
+        """Generate a unique event ID and its ISO event time from a single clock reading."""
+        self.event_counter += 1
+        now_ns = time.time_ns()
+        seconds, nanos = divmod(now_ns, 1_000_000_000)
+        event_time = f"{_utc_second_iso(seconds)}.{nanos // 1000:06d}+00:00"
+        return format_event_id(self._event_id_prefix, self.event_counter, now_ns // 1_000_000), event_time
+
     def _update_strategy_state(self) -> None:
-        """Update strategy_state dict with current values and increment seq."""
+        """Replace strategy_state with a new dict of current values (never mutated in place) and increment seq."""
         self._state_sequence += 1
-
-        if not self.entry_price:
-            # No position - empty state with seq
-            self.strategy_state = {"seq": self._state_sequence}
-        else:
-            # Active position - full state with seq
-            self.strategy_state = {
-                "SL": self.stop_loss_price,
-                "TP": self.target_price,
-                "ENTRY": self.entry_price,
-                "TSA": self.trailing_activation_price,
-                "TRAILING_STOP_ACTIVE": self.trailing_stop_active,
-                "seq": self._state_sequence,
-            }
+        # Same wire shape as IPCStrategy: only seq while flat, full state with seq otherwise
+        self.strategy_state = strategy_state_dict(
+            self._state_sequence,
+            self.entry_price,
+            self.stop_loss_price,
+            self.target_price,
+            self.trailing_activation_price,
+            self.trailing_stop_active,
+        )
 
     async def start_delayed(self, delay_seconds: int = 5) -> None:
         """
@@ -230,6 +281,22 @@ class SimpleTestStrategy:
                 self.log("INFO", "✅ Strategy task cancelled successfully")
 
         self._reset_strategy_state()
+
+        # Flush events already queued for the UI (bounded, so a hung broadcast can't block stop()),
+        # then stop the emit loop; _emit starts a fresh one if the strategy is restarted
+        emit_task = self._emit_task
+        if emit_task is not None:
+            self._emit_task = None
+            try:
+                await asyncio.wait_for(self._emit_queue.join(), timeout=EMIT_DRAIN_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                self.log("WARNING", f"Dropping events undelivered after {EMIT_DRAIN_TIMEOUT_SECONDS}s")
+                self._emit_queue = asyncio.Queue()
+            emit_task.cancel()
+            try:
+                await emit_task
+            except asyncio.CancelledError:
+                pass
         self.log("INFO", "✅ Simple Test Strategy STOPPED")
 
     async def _run_strategy_sequence(self) -> None:
@@ -274,6 +341,8 @@ class SimpleTestStrategy:
     async def _enter_trade(self) -> None:
         """Enter a test trade with stop loss and target."""
         self.entry_time = datetime.now(UTC)
+        self._offline_start_ns = time.monotonic_ns() + int(self.offline_start_delay * 1e9)
+        self._offline_end_ns = self._offline_start_ns + int(self.offline_duration * 1e9)
 
         # Use current market price as entry price, fallback to 50000 if no ticks received yet
         self.entry_price = self.current_price if self.current_price is not None else 50000.0
@@ -291,22 +360,20 @@ class SimpleTestStrategy:
         # Initialize trailing stop state
         self.trailing_stop_active = False
         self.peak_price = self.entry_price
+        self._last_checked_price = None
 
         self.log("INFO", f"✅ ENTERED {self.direction} position at ${self.entry_price:,.2f}")
         self.log("INFO", f"🛡️ Stop Loss: ${self.stop_loss_price:,.2f}")
         self.log("INFO", f"🎯 Target: ${self.target_price:,.2f}")
         self.log("INFO", f"📊 Trailing Stop Activates at: ${self.trailing_activation_price:,.2f}")
 
-        # Generate unique event ID
-        self.event_counter += 1
-        event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-        event_time = datetime.now(UTC).isoformat()
+        event_id, event_time = self._next_event_id()
 
         # Update strategy state
         self._update_strategy_state()
 
         # Broadcast OPEN event
-        await self.broadcast(
+        self._emit(
             {
                 "type": "strategy_event",
                 "data": {
@@ -323,7 +390,6 @@ class SimpleTestStrategy:
                         "predicted_price": self.target_price,
                         "stop_loss_price": self.stop_loss_price,
                         "prediction_data": {},
-                        "strategy_state": self.strategy_state,
                     },
                 },
             }
@@ -344,16 +410,13 @@ class SimpleTestStrategy:
         self.log("INFO", f"{pnl_emoji} PNL: ${pnl:,.2f} ({pnl_percentage:+.2f}%)")
         self.log("INFO", f"⏱️ Trade duration: {self.exit_delay_seconds}s")
 
-        # Generate unique event ID
-        self.event_counter += 1
-        event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-        event_time = datetime.now(UTC).isoformat()
+        event_id, event_time = self._next_event_id()
 
         # Reset strategy state before broadcast
         self._reset_strategy_state()
 
         # Broadcast CLOSE event
-        await self.broadcast(
+        self._emit(
             {
                 "type": "strategy_event",
                 "data": {
@@ -370,7 +433,6 @@ class SimpleTestStrategy:
                         "current_price": current_price,
                         "pnl": pnl,
                         "pnl_percentage": pnl_percentage,
-                        "strategy_state": self.strategy_state,
                     },
                 },
             }
@@ -389,18 +451,19 @@ class SimpleTestStrategy:
     def _reset_strategy_state(self) -> None:
         """Reset all strategy state variables."""
         self.entry_time = None
+        self._offline_start_ns = None
+        self._offline_end_ns = None
         self.entry_price = None
         self.stop_loss_price = None
         self.target_price = None
         self.trailing_activation_price = None
         self.trailing_stop_active = False
         self.peak_price = None
+        self._last_checked_price = None
         self._offline_frozen_state = None  # Clear frozen state
         # Clear debug flags for next run
-        if hasattr(self, "_logged_offline_start"):
-            delattr(self, "_logged_offline_start")
-        if hasattr(self, "_logged_suppression"):
-            delattr(self, "_logged_suppression")
+        self._logged_offline_start = False
+        self._logged_suppression = False
         self._update_strategy_state()  # Updates to empty state with seq
 
     def should_suppress_heartbeat(self) -> bool:
@@ -408,34 +471,40 @@ class SimpleTestStrategy:
         is_suppressed = self._is_in_offline_window()
 
         # Debug logging first time we suppress
-        if is_suppressed and not hasattr(self, "_logged_suppression"):
+        if is_suppressed and not self._logged_suppression:
             self._logged_suppression = True
             self.log("INFO", "🔇 DEBUG: Suppressing heartbeat - offline mode active")
 
         return is_suppressed
 
-    def get_strategy_state(self) -> dict[str, Any]:
-        """Return current strategy state for UI display."""
+    def get_strategy_state(self) -> Mapping[str, Any]:
+        """
+        Return current strategy state for UI display.
+
+        The mapping is read-only by contract and returned without copying: _update_strategy_state
+        replaces strategy_state with a new dict on every change and never mutates it in place.
+        Callers that need to modify it must take their own dict(...) copy.
+        """
         # Check if we're in offline window
         in_offline = self._is_in_offline_window()
 
         if in_offline:
             # Capture frozen state on first call during offline window
             if self._offline_frozen_state is None:
-                self._offline_frozen_state = self.strategy_state.copy()
+                self._offline_frozen_state = self.strategy_state
                 self.log(
                     "INFO",
                     f"📴 OFFLINE MODE: Freezing state at seq={self._offline_frozen_state.get('seq', 'unknown')}",
                 )
             # Return frozen state during offline window (not actually used since heartbeats are suppressed)
-            return self._offline_frozen_state.copy()
+            return self._offline_frozen_state
 
         # We're not in offline window anymore - check if we were offline before
         if self._offline_frozen_state is not None:
             self.log("INFO", f"📶 BACK ONLINE: Resuming state updates at seq={self._state_sequence}")
             self._offline_frozen_state = None  # Clear frozen state
 
-        return self.strategy_state.copy()
+        return self.strategy_state
 
     async def process_tick(self, tick_data: dict[str, Any]) -> None:
         """
@@ -444,24 +513,38 @@ class SimpleTestStrategy:
         Args:
             tick_data: Tick data with price information
         """
+        # Extract price from tick data: compressed "p" (Binance/simulated) first, then "price"
+        raw = tick_data.get("p")
+        if raw is None:
+            raw = tick_data.get("price")
+            if raw is None:
+                return  # No price: nothing can change
+
         try:
-            # Extract price from tick data
-            old_price = self.current_price
-            if "price" in tick_data:
-                self.current_price = float(tick_data["price"])
-            elif "p" in tick_data:  # Compressed format
-                self.current_price = float(tick_data["p"])
-
-            # Log first tick received
-            if old_price is None and self.current_price is not None:
-                self.log("INFO", f"📡 First tick received: ${self.current_price:,.2f}")
-
-            # Process trailing stop logic if in position
-            if self.entry_price is not None and self.current_price is not None:
-                await self._check_trailing_stop(self.current_price)
-
-        except (ValueError, KeyError) as e:
+            price = raw if type(raw) is float else float(raw)
+        except (ValueError, TypeError) as e:
             self.log("WARNING", f"⚠️ Failed to parse tick data: {e}")
+            return
+
+        await self.on_tick_compact(price)
+
+    async def on_tick_compact(self, price: float) -> None:
+        """
+        Process a pre-parsed tick: track current market price and manage trailing stops.
+
+        Args:
+            price: Trade price
+        """
+        # Log first tick received
+        if self.current_price is None:
+            self.log("INFO", f"📡 First tick received: ${price:,.2f}")
+        self.current_price = price
+
+        # Process trailing stop logic if in position. A repeat of the price last checked can't
+        # cross any threshold (the check's own state changes only happen on a new price).
+        if self.entry_price is not None and price != self._last_checked_price:
+            self._last_checked_price = price
+            await self._check_trailing_stop(price)
 
     async def _simulate_price_movement_to_target(self) -> None:
         """
@@ -489,42 +572,33 @@ class SimpleTestStrategy:
         if num_steps == 0:
             num_steps = 1
 
-        price_step = price_range / num_steps
+        price_step = price_range / num_steps if self.direction == "LONG" else -price_range / num_steps
 
         self.log("INFO", f"💫 Simulating {num_steps} price movements over {self.exit_delay_seconds}s")
         self.log("INFO", f"   Price path: ${self.entry_price:,.2f} → ${target_overshoot:,.2f}")
 
-        # Simulate price movements
+        # Whole price path up front; each step only feeds one price to the tick handler
+        price_path = [self.entry_price + price_step * step for step in range(1, num_steps + 1)]
+
+        # Simulate price movements. Steps are paced against absolute deadlines from the start, so
+        # tick processing time doesn't accumulate as drift over the whole simulation.
+        # Loop-invariant callables/values bound to locals (is_running is re-read: stop() clears it).
+        loop_time = asyncio.get_running_loop().time
+        on_tick = self.on_tick_compact
+        sleep = asyncio.sleep
+        interval = self.price_simulation_interval
+        start = loop_time()
         current_simulated_price = self.entry_price
-        for step in range(num_steps):
+        for step, price in enumerate(price_path, 1):
             if not self.is_running:
                 break
+            current_simulated_price = price
 
-            # Update simulated price
-            if self.direction == "LONG":
-                current_simulated_price += price_step
-            else:  # SHORT
-                current_simulated_price -= price_step
+            # Process the simulated tick (will trigger trailing stop logic, which logs TSA crossings)
+            await on_tick(current_simulated_price)
 
-            # Create simulated tick data
-            simulated_tick = {
-                "p": current_simulated_price,  # price
-                "simulated": True,
-            }
-
-            # Process the tick (will trigger trailing stop logic)
-            await self.process_tick(simulated_tick)
-
-            # Log key milestones
-            if not self.trailing_stop_active and self.trailing_activation_price:
-                # Check if we just crossed TSA
-                if self.direction == "LONG" and current_simulated_price >= self.trailing_activation_price:
-                    pass  # Will be logged by _check_trailing_stop
-                elif self.direction == "SHORT" and current_simulated_price <= self.trailing_activation_price:
-                    pass  # Will be logged by _check_trailing_stop
-
-            # Wait before next simulation step
-            await asyncio.sleep(self.price_simulation_interval)
+            # Wait until the next simulation step is due
+            await sleep(max(0.0, start + step * interval - loop_time()))
 
         self.log("INFO", f"✅ Price simulation complete. Final price: ${current_simulated_price:,.2f}")
 
@@ -538,63 +612,43 @@ class SimpleTestStrategy:
         if not self.entry_price or not self.stop_loss_price or not self.trailing_activation_price:
             return
 
-        # LONG position logic
-        if self.direction == "LONG":
-            # Check if trailing stop should activate
-            if not self.trailing_stop_active and current_price >= self.trailing_activation_price:
-                self.trailing_stop_active = True
-                self.peak_price = current_price
-                new_sl = self.peak_price - self.trailing_stop_distance
-                self.stop_loss_price = new_sl
-
-                self.log("INFO", f"🎯 TRAILING STOP ACTIVATED at ${current_price:,.2f}")
-                self.log("INFO", f"   New Stop Loss: ${new_sl:,.2f}")
-
-                # Broadcast trailing stop activation event
-                await self._broadcast_trailing_stop_update(current_price, "ACTIVATED")
-
-            # If trailing stop active, update peak and stop loss
-            elif self.trailing_stop_active and current_price > self.peak_price:
-                old_peak = self.peak_price
-                self.peak_price = current_price
-                new_sl = self.peak_price - self.trailing_stop_distance
-                old_sl = self.stop_loss_price
-                self.stop_loss_price = new_sl
-
-                self.log("INFO", f"📈 TRAILING STOP UPDATED: Peak ${old_peak:,.2f} → ${self.peak_price:,.2f}")
-                self.log("INFO", f"   Stop Loss: ${old_sl:,.2f} → ${new_sl:,.2f}")
-
-                # Broadcast trailing stop update event
-                await self._broadcast_trailing_stop_update(current_price, "UPDATED")
-
-        # SHORT position logic
-        else:
-            # Check if trailing stop should activate
-            if not self.trailing_stop_active and current_price <= self.trailing_activation_price:
-                self.trailing_stop_active = True
-                self.peak_price = current_price
-                new_sl = self.peak_price + self.trailing_stop_distance
-                self.stop_loss_price = new_sl
+        # Activation/peak/stop arithmetic runs in the numeric kernel; Python only handles changes.
+        # Prices are coerced to float to match the kernel's compiled signature.
+        action, new_sl, new_peak = trailing_update(
+            float(current_price),
+            self._sign,
+            float(self.stop_loss_price),
+            float(self.peak_price),
+            self.trailing_stop_active,
+            float(self.trailing_activation_price),
+            float(self.trailing_stop_distance),
+        )
+        if action == ACTION_NONE:
+            return
 
-                self.log("INFO", f"🎯 TRAILING STOP ACTIVATED at ${current_price:,.2f}")
-                self.log("INFO", f"   New Stop Loss: ${new_sl:,.2f}")
+        if action == ACTION_TRAIL_ACTIVATED:
+            self.trailing_stop_active = True
+            self.peak_price = new_peak
+            self.stop_loss_price = new_sl
 
-                # Broadcast trailing stop activation event
-                await self._broadcast_trailing_stop_update(current_price, "ACTIVATED")
+            self.log("INFO", f"🎯 TRAILING STOP ACTIVATED at ${current_price:,.2f}")
+            self.log("INFO", f"   New Stop Loss: ${new_sl:,.2f}")
 
-            # If trailing stop active, update peak and stop loss
-            elif self.trailing_stop_active and current_price < self.peak_price:
-                old_peak = self.peak_price
-                self.peak_price = current_price
-                new_sl = self.peak_price + self.trailing_stop_distance
-                old_sl = self.stop_loss_price
-                self.stop_loss_price = new_sl
+            # Broadcast trailing stop activation event
+            await self._broadcast_trailing_stop_update(current_price, "ACTIVATED")
+        else:
+            # Trailing stop active and price made a new peak: move peak and stop loss with it
+            old_peak = self.peak_price
+            old_sl = self.stop_loss_price
+            self.peak_price = new_peak
+            self.stop_loss_price = new_sl
 
-                self.log("INFO", f"📉 TRAILING STOP UPDATED: Peak ${old_peak:,.2f} → ${self.peak_price:,.2f}")
-                self.log("INFO", f"   Stop Loss: ${old_sl:,.2f} → ${new_sl:,.2f}")
+            arrow = "📈" if self._sign > 0 else "📉"
+            self.log("INFO", f"{arrow} TRAILING STOP UPDATED: Peak ${old_peak:,.2f} → ${self.peak_price:,.2f}")
+            self.log("INFO", f"   Stop Loss: ${old_sl:,.2f} → ${new_sl:,.2f}")
 
-                # Broadcast trailing stop update event
-                await self._broadcast_trailing_stop_update(current_price, "UPDATED")
+            # Broadcast trailing stop update event
+            await self._broadcast_trailing_stop_update(current_price, "UPDATED")
 
     async def _broadcast_trailing_stop_update(self, current_price: float, update_type: str) -> None:
         """
@@ -612,13 +666,10 @@ class SimpleTestStrategy:
             self.log("DEBUG", f"🔇 OFFLINE: Suppressing {update_type} broadcast during offline window")
             return
 
-        # Generate unique event ID
-        self.event_counter += 1
-        event_id = f"{self.instance_name}_{self.event_counter}_{int(datetime.now(UTC).timestamp() * 1000)}"
-        event_time = datetime.now(UTC).isoformat()
+        event_id, event_time = self._next_event_id()
 
         # Broadcast UPDATE event
-        await self.broadcast(
+        self._emit(
             {
                 "type": "strategy_event",
                 "data": {
@@ -636,7 +687,6 @@ class SimpleTestStrategy:
                         "peak_price": self.peak_price,
                         "trailing_stop_activated": True,
                         "current_price": current_price,
-                        "strategy_state": self.strategy_state,
                     },
                 },
             }
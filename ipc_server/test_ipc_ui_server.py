@@ -13,73 +13,347 @@ Demonstrates basic functionality without requiring full setup.
 Usage:
     python ipc_server/test_ipc_ui_server.py           # Test WebSocket (default)
     python ipc_server/test_ipc_ui_server.py http      # Test HTTP endpoints
+    python ipc_server/test_ipc_ui_server.py --quiet   # Per-type frame counts every second (throughput runs)
+    python ipc_server/test_ipc_ui_server.py --backend aiohttp   # WebSocket client (default: websockets)
+    python ipc_server/test_ipc_ui_server.py --sample 100        # Parse 1 in 100 trade frames (diagnostics)
+
+The WebSocket client turns off permessage-deflate (the server is local, so compression only
+adds a per-frame inflate) and, on client library versions that support it, receives text frames
+as undecoded bytes for the JSON parser (skipping the UTF-8 decode/validation pass).
+Message lines are buffered and written to stdout in batches, so a fast feed isn't throttled
+by one terminal write per frame.
 """
 
 import asyncio
+import contextlib
+import functools
+import inspect
 import json
+import re
+import socket
+import sys
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
 import websockets
 
+# Optional fast JSON decoder (falls back to the json module)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional faster event loop (libuv); not available on Windows
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+# UI server trade broadcasts are encoded with "type" first, so raw frames can be routed on this prefix
+TRADE_FRAME_PREFIX = b'{"type":"trade"'
+
+# Price of a trade frame, read without parsing: "data" is Binance's flat trade object, where "p" is the
+# only key of that name. Escaped or non-string prices don't match and take the parsers instead.
+_TRADE_PRICE_PATTERN = r'"p":"([^"\\]*)"'
+_search_trade_price = re.compile(_TRADE_PRICE_PATTERN.encode()).search
+_search_trade_price_str = re.compile(_TRADE_PRICE_PATTERN).search
+
+# WebSocket client libraries selectable with --backend (the first is the default)
+WS_BACKENDS = ("websockets", "aiohttp")
+
+# Largest WebSocket frame accepted (prediction payloads can be several hundred KB)
+WS_MAX_SIZE = 2**22
+
+# Kernel receive buffer for the WebSocket socket, so bursts of multi-KB frames queue in the kernel instead
+# of stalling the server's sends (TCP_NODELAY needs no tuning: asyncio/uvloop/aiohttp already set it)
+WS_RCVBUF_BYTES = 2 * 1024 * 1024
+
+# Buffered message output is written to stdout at most this often
+OUTPUT_FLUSH_SECONDS = 0.1
+
+# --quiet mode prints per-type frame counts this often
+STATS_INTERVAL_SECONDS = 1.0
+
+# Message types counted separately in --quiet mode (anything else counts as "other")
+STATS_TYPES = ("trade", "prediction", "strategy_event")
+_STATS_INDEX = {msg_type: i for i, msg_type in enumerate(STATS_TYPES)}
+_STATS_OTHER = len(STATS_TYPES)
+_STATS_TRADE = _STATS_INDEX["trade"]
+
+# Parse incoming frames (orjson accepts str or bytes; its JSONDecodeError subclasses json's)
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def _json_preview(data: object, limit: int = 200) -> str:
+    """Indented JSON of data, truncated to limit characters, for printing unknown messages."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()[:limit]
+    return json.dumps(data, indent=2)[:limit]
+
+
+# ============================================
+# BUFFERED OUTPUT
+# ============================================
+
+_output: list[str] = []
+
+
+def _out(line: str) -> None:
+    """Queue one output line (written by _flush_output)."""
+    _output.append(line)
+
+
+def _flush_output() -> None:
+    """Write all queued output lines to stdout in one call."""
+    if _output:
+        _output.append("")
+        sys.stdout.write("\n".join(_output))
+        _output.clear()
+        sys.stdout.flush()
+
+
+async def _flush_output_loop() -> None:
+    """Flush queued output every OUTPUT_FLUSH_SECONDS."""
+    while True:
+        await asyncio.sleep(OUTPUT_FLUSH_SECONDS)
+        _flush_output()
+
+
+# ============================================
+# MESSAGE HANDLERS (dispatched on "type", then on strategy event "position")
+# ============================================
+
+# Shared read-only default for missing nested objects (no fresh {} per lookup)
+_EMPTY: dict = {}
+
+# Precomposed %-templates for the message lines (no per-frame f-string format() dispatch)
+_TICK_TMPL = "[TICK] Price: $%s"
+_SIGNAL_TMPL = "[SIGNAL] 🚀 %s @ $%.2f, SL: $%.2f"
+_CLOSE_TMPL = "[CLOSE] 🛑 %s, PNL: $%.2f (%.2f%%)"
+_UPDATE_TMPL = "[UPDATE] 🎯 %s, New SL: $%.2f"
+
+# UPDATE reasons emitted by the strategies' trailing stop (IPCStrategy, SimpleTestStrategy)
+_TRAILING_REASONS = frozenset({"TRAILING_STOP_ACTIVATED", "TRAILING_STOP_UPDATED"})
+
+
+def _on_trade(msg_type: str, data: dict) -> None:
+    """Print a Binance tick."""
+    tick_data = data.get("data", _EMPTY)
+    price = tick_data.get("p", "N/A")
+    _out(_TICK_TMPL % (price,))
+
+
+def _on_prediction(msg_type: str, data: dict) -> None:
+    """Print a prediction update."""
+    pred_data = data.get("data", _EMPTY).get("data", _EMPTY)
+    predicted = pred_data.get("predictedMarketPrice", "N/A")
+    hours = pred_data.get("hours", "N/A")
+    _out(f"[PREDICTION] {hours}h → ${predicted}")
+
+
+def _on_open(reason: str, event_data: dict) -> None:
+    """Print a strategy entry signal."""
+    direction = event_data.get("signal_direction", "?")
+    entry = event_data.get("entry_price", 0)
+    sl = event_data.get("stop_loss_price", 0)
+    _out(_SIGNAL_TMPL % (direction, entry, sl))
+
+
+def _on_close(reason: str, event_data: dict) -> None:
+    """Print a strategy exit with its PnL."""
+    pnl = event_data.get("pnl", 0)
+    pnl_pct = event_data.get("pnl_percentage", 0)
+    _out(_CLOSE_TMPL % (reason, pnl, pnl_pct))
+
+
+def _on_update(reason: str, event_data: dict) -> None:
+    """Print a trailing stop update."""
+    if reason in _TRAILING_REASONS:
+        new_sl = event_data.get("stop_loss_price", 0)
+        _out(_UPDATE_TMPL % (reason, new_sl))
+
+
+_POSITION_HANDLERS = {"OPEN": _on_open, "CLOSE": _on_close, "UPDATE": _on_update}
+
+
+def _on_strategy_event(msg_type: str, data: dict) -> None:
+    """Print a strategy event, dispatched on its position."""
+    event = data.get("data", _EMPTY)
+    handler = _POSITION_HANDLERS.get(event.get("position", "?"))
+    if handler is not None:
+        handler(event.get("reason", "?"), event.get("event_data", _EMPTY))
+
+
+def _on_other(msg_type: str, data: dict) -> None:
+    """Print a preview of any other message type."""
+    _out(f"[{msg_type.upper()}] {_json_preview(data)}...")
 
-async def test_websocket():
-    """Test WebSocket connection and message reception."""
+
+_MESSAGE_HANDLERS = {"trade": _on_trade, "prediction": _on_prediction, "strategy_event": _on_strategy_event}
+
+
+# ============================================
+# THROUGHPUT STATS (--quiet mode)
+# ============================================
+
+def _format_stats(counts: list[int]) -> str:
+    """Format one interval's per-type frame counts."""
+    fields = [f"{msg_type}={count}" for msg_type, count in zip(STATS_TYPES, counts)]
+    fields.append(f"other={counts[_STATS_OTHER]}")
+    return f"[STATS] {' '.join(fields)} ({sum(counts)} frames / {STATS_INTERVAL_SECONDS:g}s)"
+
+
+async def _stats_loop(counts: list[int]) -> None:
+    """Queue a stats line and reset the counters every STATS_INTERVAL_SECONDS."""
+    while True:
+        await asyncio.sleep(STATS_INTERVAL_SECONDS)
+        _out(_format_stats(counts))
+        counts[:] = [0] * len(counts)
+
+
+# ============================================
+# WEBSOCKET BACKENDS (each yields an async iterator of frames and whether they are raw bytes)
+# ============================================
+
+def _enlarge_receive_buffer(sock: Any) -> None:
+    """Set SO_RCVBUF to WS_RCVBUF_BYTES on a connected socket (no-op if unavailable)."""
+    if sock is None:
+        return
+    with contextlib.suppress(OSError):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, WS_RCVBUF_BYTES)
+
+
+@contextlib.asynccontextmanager
+async def _connect_websockets(uri: str) -> AsyncIterator[tuple[AsyncIterator[str | bytes], bool]]:
+    """Connect with the websockets library."""
+    async with websockets.connect(uri, compression=None, max_size=WS_MAX_SIZE, max_queue=1024) as websocket:
+        transport = getattr(websocket, "transport", None)
+        _enlarge_receive_buffer(transport.get_extra_info("socket") if transport is not None else None)
+
+        # Raw frame bytes where recv() supports decode=False (websockets asyncio client)
+        recv = websocket.recv
+        raw = "decode" in inspect.signature(recv).parameters
+        if raw:
+            recv = functools.partial(recv, decode=False)
+
+        async def frames() -> AsyncIterator[str | bytes]:
+            while True:
+                try:
+                    yield await recv()
+                except websockets.ConnectionClosedOK:
+                    return
+
+        yield frames(), raw
+
+
+@contextlib.asynccontextmanager
+async def _connect_aiohttp(uri: str) -> AsyncIterator[tuple[AsyncIterator[str | bytes], bool]]:
+    """Connect with aiohttp's WebSocket client."""
+    import aiohttp
+
+    # Raw text frame bytes where ws_connect() supports decode_text=False (aiohttp 3.12+)
+    options: dict[str, Any] = {"compress": 0, "max_msg_size": WS_MAX_SIZE}
+    raw = "decode_text" in inspect.signature(aiohttp.ClientSession.ws_connect).parameters
+    if raw:
+        options["decode_text"] = False
+
+    async with aiohttp.ClientSession() as session:
+        try:
+            ws = await session.ws_connect(uri, **options)
+        except aiohttp.ClientConnectorError as e:
+            if isinstance(e.os_error, ConnectionRefusedError):
+                raise ConnectionRefusedError(str(e)) from e
+            raise
+
+        async def frames() -> AsyncIterator[str | bytes]:
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    yield msg.data
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    raise ws.exception()
+
+        async with ws:
+            _enlarge_receive_buffer(ws.get_extra_info("socket"))
+            yield frames(), raw
+
+
+_WS_CONNECTORS = {"websockets": _connect_websockets, "aiohttp": _connect_aiohttp}
+
+
+async def test_websocket(quiet: bool = False, backend: str = WS_BACKENDS[0], sample: int = 1):
+    """
+    Test WebSocket connection and message reception.
+
+    Args:
+        quiet: Only parse and count frames per message type (no per-message output), printing the
+            counts every STATS_INTERVAL_SECONDS, for throughput runs
+        backend: WebSocket client library, one of WS_BACKENDS
+        sample: Parse only every Nth trade frame (others are recognised by their prefix and skipped
+            unparsed); all other message types are always handled
+    """
     uri = "ws://localhost:8765/ws"
 
     print("Connecting to IPC UI Server WebSocket...")
-    print(f"URI: {uri}")
+    print(f"URI: {uri} ({backend})")
     print()
 
+    frames = 0
+    trade_frames = 0
+    counts = [0] * (len(STATS_TYPES) + 1)
+    flush_task = None
+    stats_task = None
     try:
-        async with websockets.connect(uri) as websocket:
+        async with _WS_CONNECTORS[backend](uri) as (frame_iter, raw):
             print("✅ Connected successfully!")
             print("Listening for messages (Ctrl+C to stop)...")
             print("-" * 60)
+            flush_task = asyncio.create_task(_flush_output_loop())
+            if quiet:
+                stats_task = asyncio.create_task(_stats_loop(counts))
+
+            trade_prefix = TRADE_FRAME_PREFIX if raw else TRADE_FRAME_PREFIX.decode()
+            search_trade_price = _search_trade_price if raw else _search_trade_price_str
+            price_start = len(trade_prefix)
+
+            async for message in frame_iter:
+                frames += 1
+
+                # Trade frames: sample, then peek the price before any parser runs
+                if message.startswith(trade_prefix):
+                    if sample > 1:
+                        trade_frames += 1
+                        if trade_frames % sample:
+                            if quiet:
+                                counts[_STATS_TRADE] += 1
+                            continue
+
+                    match = search_trade_price(message, price_start)
+                    if match is not None:
+                        if quiet:
+                            counts[_STATS_TRADE] += 1
+                        else:
+                            price = match[1]
+                            _out(_TICK_TMPL % (price.decode() if raw else price,))
+                        continue
 
-            async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     msg_type = data.get("type", "unknown")
-
-                    if msg_type == "trade":
-                        tick_data = data.get("data", {})
-                        price = tick_data.get("p", "N/A")
-                        print(f"[TICK] Price: ${price}")
-
-                    elif msg_type == "prediction":
-                        pred_data = data.get("data", {}).get("data", {})
-                        predicted = pred_data.get("predictedMarketPrice", "N/A")
-                        hours = pred_data.get("hours", "N/A")
-                        print(f"[PREDICTION] {hours}h → ${predicted}")
-
-                    elif msg_type == "strategy_event":
-                        event = data.get("data", {})
-                        position = event.get("position", "?")
-                        reason = event.get("reason", "?")
-                        event_data = event.get("event_data", {})
-
-                        if position == "OPEN":
-                            direction = event_data.get("signal_direction", "?")
-                            entry = event_data.get("entry_price", 0)
-                            sl = event_data.get("stop_loss_price", 0)
-                            print(f"[SIGNAL] 🚀 {direction} @ ${entry:.2f}, SL: ${sl:.2f}")
-
-                        elif position == "CLOSE":
-                            pnl = event_data.get("pnl", 0)
-                            pnl_pct = event_data.get("pnl_percentage", 0)
-                            print(f"[CLOSE] 🛑 {reason}, PNL: ${pnl:.2f} ({pnl_pct:.2f}%)")
-
-                        elif position == "UPDATE":
-                            if "TRAILING" in reason:
-                                new_sl = event_data.get("stop_loss_price", 0)
-                                print(f"[UPDATE] 🎯 {reason}, New SL: ${new_sl:.2f}")
-
-                    else:
-                        print(f"[{msg_type.upper()}] {json.dumps(data, indent=2)[:200]}...")
+                    if quiet:
+                        counts[_STATS_INDEX.get(msg_type, _STATS_OTHER)] += 1
+                        continue
+                    _MESSAGE_HANDLERS.get(msg_type, _on_other)(msg_type, data)
 
                 except json.JSONDecodeError:
-                    print(f"[ERROR] Invalid JSON: {message[:100]}")
+                    # Frames stay bytes on the hot path; decode only for this preview
+                    preview = message[:100]
+                    if isinstance(preview, bytes):
+                        preview = preview.decode("utf-8", "replace")
+                    _out(f"[ERROR] Invalid JSON: {preview}")
                 except Exception as e:
-                    print(f"[ERROR] {e}")
+                    _out(f"[ERROR] {e}")
 
     except ConnectionRefusedError:
         print("❌ Connection refused. Is the server running?")
@@ -92,6 +366,14 @@ async def test_websocket():
         print("\n\nStopped by user")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        if stats_task is not None:
+            stats_task.cancel()
+        if flush_task is not None:
+            flush_task.cancel()
+        _flush_output()
+        if frames:
+            print(f"Received {frames} frames")
 
 
 async def test_http_api():
@@ -104,49 +386,67 @@ async def test_http_api():
     print(f"Base URL: {base_url}")
     print()
 
-    async with aiohttp.ClientSession() as session:
-        # Test mode endpoint
-        try:
-            async with session.get(f"{base_url}/api/mode") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"✅ /api/mode → {data['mode']}")
-                else:
-                    print(f"❌ /api/mode → HTTP {resp.status}")
-        except Exception as e:
-            print(f"❌ /api/mode → {e}")
-
-        # Test predictions endpoint
-        try:
-            async with session.get(f"{base_url}/api/predictions") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"✅ /api/predictions → {len(data)} cached predictions")
-                else:
-                    print(f"❌ /api/predictions → HTTP {resp.status}")
-        except Exception as e:
-            print(f"❌ /api/predictions → {e}")
+    # One keep-alive connection pool for all probes (repeat requests skip the TCP handshake)
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def probe(path: str, describe: Callable[[Any], str]) -> str:
+            """GET one endpoint and return its result line."""
+            try:
+                async with session.get(f"{base_url}{path}") as resp:
+                    if resp.status != 200:
+                        return f"❌ {path} → HTTP {resp.status}"
+                    return f"✅ {path} → {describe(_json_loads(await resp.read()))}"
+            except Exception as e:
+                return f"❌ {path} → {e}"
+
+        # Independent endpoints, probed concurrently; results printed in request order
+        results = await asyncio.gather(
+            probe("/api/mode", lambda data: data["mode"]),
+            probe("/api/predictions", lambda data: f"{len(data)} cached predictions"),
+        )
+        for line in results:
+            print(line)
 
     print()
 
 
+def _option_value(args: list[str], name: str, default: str) -> str:
+    """Return the value following option `name` in args (default if absent, "" if it has no value)."""
+    if name not in args:
+        return default
+    i = args.index(name) + 1
+    return args[i] if i < len(args) else ""
+
+
 async def main():
     """Main test function."""
-    import sys
-
     print("=" * 60)
     print("IPC UI Server Test Script")
     print("=" * 60)
     print()
 
-    if len(sys.argv) > 1 and sys.argv[1] == "http":
+    args = sys.argv[1:]
+    if args and args[0] == "http":
         await test_http_api()
-    else:
-        await test_websocket()
+        return
+
+    backend = _option_value(args, "--backend", WS_BACKENDS[0])
+    if backend not in WS_BACKENDS:
+        print(f"❌ --backend must be one of: {', '.join(WS_BACKENDS)}")
+        return
+    sample = _option_value(args, "--sample", "1")
+    if not sample.isdigit() or int(sample) < 1:
+        print("❌ --sample must be a positive integer")
+        return
+    await test_websocket(quiet="--quiet" in args, backend=backend, sample=int(sample))
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if HAS_UVLOOP:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nExiting...")
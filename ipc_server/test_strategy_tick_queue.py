@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# © 2025 Cayman Sunsets Holidays Ltd. All rights reserved.
+#
+# This software and its source code are proprietary and confidential.
+# Unauthorized copying, distribution, or modification of this file, in
+# whole or in part, without the express written permission of
+# Cayman Sunsets Holidays Ltd is strictly prohibited.
+"""
+Tests for the IPC strategy tick queue in ipc_ui_server: prices that arrive while the queue is
+full are coalesced into low/high/last (in the order reached) instead of being dropped.
+
+Usage:
+    python -m pytest ipc_server/test_strategy_tick_queue.py
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("websockets")
+pytest.importorskip("dotenv")
+
+from ipc_server.ipc_ui_server import IPCUIServer  # noqa: E402
+
+QUEUED = [100.0, 101.0]
+
+
+class _RecordingStrategy:
+    """Stands in for IPCStrategy, recording each batch of prices it is handed."""
+
+    def __init__(self):
+        self.batches: list[list[float]] = []
+
+    async def check_position_management_prices(self, prices):
+        self.batches.append(list(prices))
+
+
+def _run(overflow_prices):
+    """Fill a two-slot tick queue, push overflow_prices past it, then drain once."""
+
+    async def scenario():
+        server = IPCUIServer(log_level="ERROR")
+        server.strategy_tick_queue = asyncio.Queue(maxsize=len(QUEUED))
+        server.strategy = _RecordingStrategy()
+
+        for price in QUEUED + overflow_prices:
+            await server._queue_strategy_tick(price)
+
+        task = asyncio.create_task(server._strategy_tick_loop())
+        await asyncio.sleep(0)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        return server
+
+    return asyncio.run(scenario())
+
+
+def test_no_overflow_passes_prices_through():
+    server = _run([])
+    assert server.strategy.batches == [QUEUED]
+
+
+def test_overflow_low_reached_last_keeps_high_then_low():
+    server = _run([105.0, 110.0, 90.0, 95.0])
+    assert server.strategy.batches == [QUEUED + [110.0, 90.0, 95.0]]
+
+
+def test_overflow_high_reached_last_keeps_low_then_high():
+    server = _run([105.0, 90.0, 110.0, 107.0])
+    assert server.strategy.batches == [QUEUED + [90.0, 110.0, 107.0]]
+
+
+def test_overflow_last_price_is_an_extreme():
+    server = _run([105.0, 90.0])
+    assert server.strategy.batches == [QUEUED + [105.0, 90.0, 90.0]]
+
+
+def test_single_overflow_price():
+    server = _run([105.0])
+    assert server.strategy.batches == [QUEUED + [105.0, 105.0, 105.0]]
+
+
+def test_overflow_state_resets_after_drain():
+    server = _run([105.0, 90.0, 110.0])
+    assert server._tick_overflow == []
+    assert server._tick_overflow_count == 0
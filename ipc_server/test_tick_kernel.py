@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# © 2025 Cayman Sunsets Holidays Ltd. All rights reserved.
+#
+# This software and its source code are proprietary and confidential.
+# Unauthorized copying, distribution, or modification of this file, in
+# whole or in part, without the express written permission of
+# Cayman Sunsets Holidays Ltd is strictly prohibited.
+"""
+Tests for the per-tick position kernels in ipc_server._tick_kernel.
+
+Each kernel is checked against the original per-direction LONG/SHORT branch logic it replaced.
+When Numba is installed both the compiled kernel and its pure-Python source are tested; without
+it the plain-Python kernel is tested on its own.
+
+Usage:
+    python -m pytest ipc_server/test_tick_kernel.py
+"""
+
+import itertools
+
+import pytest
+
+from ipc_server._tick_kernel import (
+    ACTION_NONE,
+    ACTION_STOP_HIT,
+    ACTION_TIME_EXIT,
+    ACTION_TRAIL_ACTIVATED,
+    ACTION_TRAIL_UPDATED,
+    HAS_NUMBA,
+    tick_update,
+    trailing_update,
+)
+
+ENTRY = 100_000.0
+STOP_POINTS = 2000.0
+ACTIVATION_OFFSET = 1000.0
+TRAIL_DISTANCE = 900.0
+MAX_DURATION_NS = 7_200_000_000_000
+
+
+def _implementations(kernel):
+    """The kernel as called in production, plus its Python source when Numba compiled it."""
+    if HAS_NUMBA:
+        return [pytest.param(kernel, id="numba"), pytest.param(kernel.py_func, id="python")]
+    return [pytest.param(kernel, id="python")]
+
+
+def _baseline_tick(direction, price, stop_loss, peak, trailing_active, activation, distance, elapsed_ns, max_ns):
+    """IPCStrategy.check_position_management before the kernel: explicit LONG/SHORT branches."""
+    if elapsed_ns > max_ns:
+        return ACTION_TIME_EXIT, stop_loss, peak
+
+    if direction == "LONG":
+        if price <= stop_loss:
+            return ACTION_STOP_HIT, stop_loss, peak
+        if trailing_active:
+            if price > peak:
+                return ACTION_TRAIL_UPDATED, price - distance, price
+        elif price >= activation:
+            return ACTION_TRAIL_ACTIVATED, price - distance, price
+    else:
+        if price >= stop_loss:
+            return ACTION_STOP_HIT, stop_loss, peak
+        if trailing_active:
+            if price < peak:
+                return ACTION_TRAIL_UPDATED, price + distance, price
+        elif price <= activation:
+            return ACTION_TRAIL_ACTIVATED, price + distance, price
+
+    return ACTION_NONE, stop_loss, peak
+
+
+def _baseline_trailing(direction, price, stop_loss, peak, trailing_active, activation, distance):
+    """SimpleTestStrategy._check_trailing_stop before the kernel: explicit LONG/SHORT branches."""
+    if direction == "LONG":
+        if not trailing_active and price >= activation:
+            return ACTION_TRAIL_ACTIVATED, price - distance, price
+        if trailing_active and price > peak:
+            return ACTION_TRAIL_UPDATED, price - distance, price
+    else:
+        if not trailing_active and price <= activation:
+            return ACTION_TRAIL_ACTIVATED, price + distance, price
+        if trailing_active and price < peak:
+            return ACTION_TRAIL_UPDATED, price + distance, price
+    return ACTION_NONE, stop_loss, peak
+
+
+def _position(direction):
+    """(sign, stop loss, trailing activation price) for a fresh position at ENTRY."""
+    sign = 1 if direction == "LONG" else -1
+    return sign, ENTRY - sign * STOP_POINTS, ENTRY + sign * ACTIVATION_OFFSET
+
+
+# (case id, direction, price offset from entry in the position's favour, trailing active,
+#  peak offset from entry in the position's favour, elapsed ns, expected action)
+TICK_CASES = [
+    ("flat", 0.0, False, 0.0, 0, ACTION_NONE),
+    ("stop_hit_at_stop", -STOP_POINTS, False, 0.0, 0, ACTION_STOP_HIT),
+    ("stop_hit_past_stop", -STOP_POINTS - 1.0, False, 0.0, 0, ACTION_STOP_HIT),
+    ("just_above_stop", -STOP_POINTS + 0.5, False, 0.0, 0, ACTION_NONE),
+    ("activation_at_price", ACTIVATION_OFFSET, False, 0.0, 0, ACTION_TRAIL_ACTIVATED),
+    ("activation_past_price", ACTIVATION_OFFSET + 10.0, False, 0.0, 0, ACTION_TRAIL_ACTIVATED),
+    ("just_short_of_activation", ACTIVATION_OFFSET - 0.5, False, 0.0, 0, ACTION_NONE),
+    ("trail_new_peak", 1500.0, True, 1200.0, 0, ACTION_TRAIL_UPDATED),
+    ("trail_equal_peak", 1200.0, True, 1200.0, 0, ACTION_NONE),
+    ("trail_below_peak", 1100.0, True, 1200.0, 0, ACTION_NONE),
+    ("time_exit", 0.0, False, 0.0, MAX_DURATION_NS + 1, ACTION_TIME_EXIT),
+    ("time_at_limit", 0.0, False, 0.0, MAX_DURATION_NS, ACTION_NONE),
+    ("time_exit_beats_stop", -STOP_POINTS, False, 0.0, MAX_DURATION_NS + 1, ACTION_TIME_EXIT),
+]
+
+
+@pytest.mark.parametrize("kernel", _implementations(tick_update))
+@pytest.mark.parametrize("direction", ["LONG", "SHORT"])
+@pytest.mark.parametrize(
+    "offset,trailing_active,peak_offset,elapsed_ns,expected",
+    [pytest.param(*case[1:], id=case[0]) for case in TICK_CASES],
+)
+def test_tick_update_action(kernel, direction, offset, trailing_active, peak_offset, elapsed_ns, expected):
+    sign, stop_loss, activation = _position(direction)
+    price = ENTRY + sign * offset
+    peak = ENTRY + sign * peak_offset
+
+    result = kernel(
+        price, sign, stop_loss, peak, trailing_active, activation, TRAIL_DISTANCE, elapsed_ns, MAX_DURATION_NS
+    )
+
+    assert result[0] == expected
+    assert result == _baseline_tick(
+        direction, price, stop_loss, peak, trailing_active, activation, TRAIL_DISTANCE, elapsed_ns, MAX_DURATION_NS
+    )
+    if expected in (ACTION_TRAIL_ACTIVATED, ACTION_TRAIL_UPDATED):
+        assert result[1:] == (price - sign * TRAIL_DISTANCE, price)
+
+
+@pytest.mark.parametrize("kernel", _implementations(tick_update))
+@pytest.mark.parametrize("direction", ["LONG", "SHORT"])
+def test_tick_update_matches_baseline_grid(kernel, direction):
+    sign, stop_loss, activation = _position(direction)
+    offsets = [-2500.0, -STOP_POINTS, -1999.5, -500.0, 0.0, 999.5, ACTIVATION_OFFSET, 1200.0, 1500.0]
+    for offset, peak_offset, trailing_active, elapsed_ns in itertools.product(
+        offsets, [1000.0, 1200.0], [False, True], [0, MAX_DURATION_NS, MAX_DURATION_NS + 1]
+    ):
+        price = ENTRY + sign * offset
+        peak = ENTRY + sign * peak_offset
+        args = (price, stop_loss, peak, trailing_active, activation, TRAIL_DISTANCE, elapsed_ns, MAX_DURATION_NS)
+        assert kernel(price, sign, *args[1:]) == _baseline_tick(direction, *args)
+
+
+# (case id, price offset from entry in the position's favour, trailing active,
+#  peak offset from entry in the position's favour, expected action)
+TRAILING_CASES = [
+    ("below_activation", ACTIVATION_OFFSET - 0.5, False, 0.0, ACTION_NONE),
+    ("activation_at_price", ACTIVATION_OFFSET, False, 0.0, ACTION_TRAIL_ACTIVATED),
+    ("activation_past_price", ACTIVATION_OFFSET + 10.0, False, 0.0, ACTION_TRAIL_ACTIVATED),
+    ("trail_new_peak", 1500.0, True, 1200.0, ACTION_TRAIL_UPDATED),
+    ("trail_equal_peak", 1200.0, True, 1200.0, ACTION_NONE),
+    ("trail_below_peak", 1100.0, True, 1200.0, ACTION_NONE),
+    ("no_stop_exit", -STOP_POINTS - 1.0, False, 0.0, ACTION_NONE),
+]
+
+
+@pytest.mark.parametrize("kernel", _implementations(trailing_update))
+@pytest.mark.parametrize("direction", ["LONG", "SHORT"])
+@pytest.mark.parametrize(
+    "offset,trailing_active,peak_offset,expected",
+    [pytest.param(*case[1:], id=case[0]) for case in TRAILING_CASES],
+)
+def test_trailing_update_action(kernel, direction, offset, trailing_active, peak_offset, expected):
+    sign, stop_loss, activation = _position(direction)
+    price = ENTRY + sign * offset
+    peak = ENTRY + sign * peak_offset
+
+    result = kernel(price, sign, stop_loss, peak, trailing_active, activation, TRAIL_DISTANCE)
+
+    assert result[0] == expected
+    assert result == _baseline_trailing(direction, price, stop_loss, peak, trailing_active, activation, TRAIL_DISTANCE)